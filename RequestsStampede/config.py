@@ -4,17 +4,20 @@ configuration values.
 """
 
 
+import os
+import stat
 import pathlib
 import abc
 import typing
-
-import schema
-import yaml
+import functools
 
 import RequestsStampede.exceptions
 import RequestsStampede.policy.retry
 import RequestsStampede.policy.backoff
 
+# Note: yaml and schema are imported lazily, by parse() and its helpers, so
+# that consumers who provide their own retry configuration never import them.
+
 
 class AbstractRetryConfig(abc.ABC):
     """
@@ -58,30 +61,25 @@ class AbstractRetryConfig(abc.ABC):
         :type backoff_policy: RequestsStampede.policy.backoff.AbstractBackoffPolicy
         """
 
-        if retry_enabled:
+        if retry_enabled is not None:
             self.retry_enabled = retry_enabled
 
         if retry_policy:
             self.retry_policy = retry_policy
 
-        if backoff_enabled:
+        if backoff_enabled is not None:
             self.backoff_enabled = backoff_enabled
 
         if backoff_policy:
             self.backoff_policy = backoff_policy
 
     def __repr__(self):
+        cls = type(self)
         return (
-            "<{}.{} object at {} retry_enabled={} retry_policy={} "
-            "backoff_enabled={} backoff_policy={}>"
-        ).format(
-            __class__.__module__,
-            __class__.__name__,
-            hex(id(self)),
-            self.retry_enabled,
-            self.retry_policy,
-            self.backoff_enabled,
-            self.backoff_policy,
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"retry_enabled={self.retry_enabled} retry_policy={self.retry_policy} "
+            f"backoff_enabled={self.backoff_enabled} "
+            f"backoff_policy={self.backoff_policy}>"
         )
 
 
@@ -143,12 +141,17 @@ class CustomRetryConfig(DefaultRetryConfig):
     """
 
 
+@functools.lru_cache(maxsize=1)
 def load() -> AbstractRetryConfig:
     """
     Determines the default behavior of RequestsStampede. If a configuration
     file is located, the contents of that file are parsed and returned. If no
     configuration file is located, the default retry configuration is returned.
 
+    The result is cached for the lifetime of the process, so the file-system
+    is only traversed once regardless of how many RetryRequest or RetrySession
+    objects are created. Use load.cache_clear() to force a fresh lookup.
+
     :return: A default, environment specific, retry configuration object.
     :rtype: AbstractRetryConfig
     """
@@ -171,6 +174,11 @@ def resolve_path(filename: str = "stampede.yml") -> pathlib.Path:
     directory will be inspected. If the filename does not exist there, a None
     value will be returned.
 
+    The search may be bypassed by way of environment variables: if
+    REQUESTSSTAMPEDE_NO_CONFIG is set to a non-empty value, None is returned
+    immediately. Otherwise, if REQUESTSSTAMPEDE_CONFIG is set, only the file at
+    that path is considered.
+
     Example: Runtime CWD = /etc/application/
 
     1) /etc/application/stampede.yml
@@ -186,58 +194,102 @@ def resolve_path(filename: str = "stampede.yml") -> pathlib.Path:
     :rtype: pathlib.Path
     """
 
-    # Begin at the current working directory
-    dir_path = pathlib.Path.cwd()
+    # Environments known not to have a configuration file skip the search
+    if os.environ.get("REQUESTSSTAMPEDE_NO_CONFIG"):
+        return None
 
-    # Parent directory loop
-    while True:
-        file_path = dir_path / filename
+    # An explicitly configured path is the only candidate considered
+    explicit_path = os.environ.get("REQUESTSSTAMPEDE_CONFIG")
 
-        # If the file exists, return its path
-        if file_path.is_file():
-            return file_path
+    if explicit_path:
+        try:
+            file_stat = os.stat(explicit_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
 
-        # If we're at the root directory (i.e. both current dir and parent are
-        # the same), than break out of the parent directory loop
-        if dir_path == dir_path.parent:
-            break
+        if stat.S_ISREG(file_stat.st_mode):
+            return pathlib.Path(explicit_path)
 
-        # Examine the parent directory
-        dir_path = dir_path.parent
+        return None
 
-    # Since a file has not been located yet, examine the effective user's home
-    # directory
-    dir_path = pathlib.Path.home()
-    file_path = dir_path / filename
+    for file_path in _candidate_paths(filename):
+        # A single stat per candidate; missing files (and path components that
+        # are not directories) are simply skipped
+        try:
+            file_stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
 
-    if file_path.is_file():
-        return file_path
+        # If the file exists, return its path
+        if stat.S_ISREG(file_stat.st_mode):
+            return pathlib.Path(file_path)
 
     return None
 
 
-def parse(path: pathlib.Path = None) -> CustomRetryConfig:
+def _candidate_paths(filename: str) -> typing.Iterator[str]:
     """
-    Parses the provided retry configuration path and returns an initialized
-    CustomRetryConfig object.
+    Yields candidate retry configuration file paths, in order of precedence:
+    within the current working directory, each of its parents up to the root
+    directory, and finally the effective user's home directory. The home
+    directory is skipped if it was already examined as an ancestor of the
+    working directory.
 
-    :param path: A retry configuration file path.
+    Paths are handled as plain strings, rather than pathlib.Path objects, as
+    this is called on every process' first retry request.
 
-    :type path: pathlib.Path
+    :param filename: The expected retry configuration filename
 
-    :return: An initialized CustomRetryConfig object.
-    :rtype: CustomRetryConfig
+    :type filename: str
+
+    :return: A generator of file paths.
+    :rtype: typing.Iterator[str]
+    """
+
+    visited = set()
+    dir_path = os.getcwd()
+
+    while True:
+        visited.add(dir_path)
+        yield os.path.join(dir_path, filename)
+
+        parent_path = os.path.dirname(dir_path)
+
+        # The root directory is its own parent
+        if parent_path == dir_path:
+            break
+
+        dir_path = parent_path
+
+    home_path = os.path.expanduser("~")
+
+    if home_path not in visited:
+        yield os.path.join(home_path, filename)
+
+
+@functools.lru_cache(maxsize=1)
+def _config_schema():
     """
+    Builds the retry configuration file schema, once, to be shared by every
+    parse().
+
+    Note: schema.Or(only_one=True) keeps a match counter between validations,
+    so it must not be used here; each alternative is already mutually exclusive
+    by way of its "type" value.
 
-    # Define the retry configuration file schema
-    config_schema = schema.Schema(
+    :return: The retry configuration file schema.
+    :rtype: schema.Schema
+    """
+
+    import schema  # pylint: disable=import-outside-toplevel
+
+    return schema.Schema(
         {
             "retry_config": {
                 schema.Optional("retry_enabled", default=True): bool,
                 schema.Optional("retry_policy"): schema.Or(
                     {"type": "fixed", "attempts": int},
                     {"type": "infinite"},
-                    only_one=True,
                 ),
                 schema.Optional("backoff_enabled", default=True): bool,
                 schema.Optional("backoff_policy"): schema.Or(
@@ -248,41 +300,100 @@ def parse(path: pathlib.Path = None) -> CustomRetryConfig:
                         "initial_delay": float,
                         "maximum_delay": float,
                     },
-                    only_one=True,
+                    {
+                        "type": "exponential",
+                        "initial_delay": float,
+                        "maximum_delay": float,
+                        schema.Optional("factor"): float,
+                        schema.Optional("jitter"): float,
+                    },
                 ),
             }
         }
     )
 
+
+@functools.lru_cache(maxsize=1)
+def _yaml_loader():
+    """
+    Returns the YAML loader used to read retry configuration files, preferring
+    the libyaml backed loader when PyYAML was built with it.
+
+    :return: A safe YAML loader class.
+    :rtype: type
+    """
+
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Previously parsed retry configurations, keyed by file path. Each entry also
+# records the file's modification time and size so that edits are picked up.
+_PARSE_CACHE: typing.Dict[str, typing.Tuple[tuple, CustomRetryConfig]] = {}
+
+
+def parse(path: pathlib.Path = None) -> CustomRetryConfig:
+    """
+    Parses the provided retry configuration path and returns an initialized
+    CustomRetryConfig object. The parsed object is cached and returned as-is
+    on subsequent calls, until the file's modification time or size changes.
+
+    :param path: A retry configuration file path.
+
+    :type path: pathlib.Path
+
+    :return: An initialized CustomRetryConfig object.
+    :rtype: CustomRetryConfig
+    """
+
+    file_stat = os.stat(path)
+    cache_key = str(path)
+    cache_stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+
+    cached = _PARSE_CACHE.get(cache_key)
+
+    if cached is not None and cached[0] == cache_stamp:
+        return cached[1]
+
+    import schema  # pylint: disable=import-outside-toplevel
+    import yaml  # pylint: disable=import-outside-toplevel
+
     with open(path) as handler:
-        config_dict = yaml.safe_load(handler)
+        config_dict = yaml.load(handler, Loader=_yaml_loader())
 
-        # Validate the configuration file
-        try:
-            config_schema.validate(config_dict)
-        except schema.SchemaError as e:
-            raise RequestsStampede.exceptions.InvalidRetryConfigFile(path, e)
+    # Validate the configuration file. The validated copy returned by the
+    # schema has its optional defaults filled in, so it is used from here on
+    # rather than walking the raw document a second time.
+    try:
+        config_dict = _config_schema().validate(config_dict)
+    except schema.SchemaError as e:
+        raise RequestsStampede.exceptions.InvalidRetryConfigFile(path, e)
 
-        # Retrieve retry configuration values
-        retry_config = config_dict.get("retry_config")
+    # Retrieve retry configuration values
+    retry_config = config_dict["retry_config"]
 
-        retry_enabled = retry_config.get("retry_enabled")
-        retry_policy = retry_config.get("retry_policy")
-        backoff_enabled = retry_config.get("backoff_enabled")
-        backoff_policy = retry_config.get("backoff_policy")
+    # Build retry policies; omitted policies are left as None such that the
+    # default retry configuration's policies are inherited
+    retry_policy = retry_config.get("retry_policy")
+    backoff_policy = retry_config.get("backoff_policy")
 
-        # Build retry policies
-        custom_retry_policy = RequestsStampede.policy.retry.CustomRetryPolicy(
-            retry_policy
-        )
-        custom_backoff_policy = RequestsStampede.policy.backoff.CustomBackoffPolicy(
+    if retry_policy is not None:
+        retry_policy = RequestsStampede.policy.retry.CustomRetryPolicy(retry_policy)
+
+    if backoff_policy is not None:
+        backoff_policy = RequestsStampede.policy.backoff.CustomBackoffPolicy(
             backoff_policy
         )
 
-        # Assemble final custom retry configuration
-        return CustomRetryConfig(
-            retry_enabled=retry_enabled,
-            retry_policy=custom_retry_policy,
-            backoff_enabled=backoff_enabled,
-            backoff_policy=custom_backoff_policy,
-        )
+    # Assemble final custom retry configuration
+    custom_retry_config = CustomRetryConfig(
+        retry_enabled=retry_config["retry_enabled"],
+        retry_policy=retry_policy,
+        backoff_enabled=retry_config["backoff_enabled"],
+        backoff_policy=backoff_policy,
+    )
+
+    _PARSE_CACHE[cache_key] = (cache_stamp, custom_retry_config)
+
+    return custom_retry_config
@@ -3,7 +3,12 @@ All internal exceptions within the RequestStampede package.
 """
 
 
-import schema
+import typing
+
+# schema is only needed for type annotations; it is imported lazily by
+# RequestsStampede.config when a retry configuration file is parsed
+if typing.TYPE_CHECKING:
+    import schema
 
 
 class InvalidRetryConfigFile(Exception):
@@ -12,7 +17,7 @@ class InvalidRetryConfigFile(Exception):
     valid.
     """
 
-    def __init__(self, path: str, schema_error: schema.SchemaError):
+    def __init__(self, path: str, schema_error: "schema.SchemaError"):
         """
         TODO
         """
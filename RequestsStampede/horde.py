@@ -1,26 +1,47 @@
 """
 The main source code for the RequestsStampede package: contains the
 RetryRequest and RetrySession wrapper classes that provide interfaces to invoke
-HTTP GET, OPTIONS, HEAD, POST, PUT, PATCH, and DELETE requests.
+HTTP GET, OPTIONS, HEAD, POST, PUT, PATCH, and DELETE requests, as well as
+their asyncio counterpart, AsyncRetryRequest.
 """
 
 
 import abc
 import typing
+import functools
 import logging
-import time
+from time import monotonic, sleep
 
 import requests
+import requests.adapters
 import requests.exceptions
 
 import RequestsStampede.config
 import RequestsStampede.models
 import RequestsStampede.exceptions
 
+# asyncio and httpx are only required by AsyncRetryRequest, and are imported on
+# its first use so that synchronous users do not pay for them
+if typing.TYPE_CHECKING:
+    import httpx
+
 
 module_logger = logging.getLogger(__name__)
 
 
+async def _async_sleep(delay: float):
+    """
+    Awaits asyncio.sleep(), importing asyncio on first use.
+
+    :param delay: The number of seconds to sleep.
+
+    :type delay: float
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    await asyncio.sleep(delay)
+
+
 class AbstractRetryRequest(abc.ABC):
     """
     The AbstractRetryRequest object Provides a base constructor interface for
@@ -55,8 +76,12 @@ class AbstractRetryRequest(abc.ABC):
         :type session: requests.Session
         """
 
-        if retry_config:
-            self.retry_config = retry_config
+        # Fall back to the (cached) environment specific configuration only
+        # when the end-user has not supplied their own, either here or as a
+        # class attribute of a subclass
+        self.retry_config = (
+            retry_config or self.retry_config or RequestsStampede.config.load()
+        )
 
         if session:
             self.session = session
@@ -88,10 +113,14 @@ class RetryRequest(AbstractRetryRequest):
     https://github.com/PatrickMurray/RequestsStampede/issues/new
     """
 
-    retry_config = RequestsStampede.config.load()
+    retry_config = None
     session = None
     logger = module_logger.getChild("RetryRequest")
 
+    # Lazily created, per instance, when no session has been provided; see
+    # _request_session()
+    _default_adapter: typing.Optional[requests.adapters.HTTPAdapter] = None
+
     def _request_handler(
         self, http_method: str, url: str, kwargs: dict
     ) -> requests.Response:
@@ -133,16 +162,32 @@ class RetryRequest(AbstractRetryRequest):
         :rtype: requests.Response
         """
 
+        session = self._request_session()
+
+        # If only a single attempt will ever be made, there is no attempt
+        # sequence to build - transmit the request directly
+        if (
+            not self.retry_config.retry_enabled
+            or self.retry_config.retry_policy.attempts == 1
+        ):
+            return self._single_request_handler(http_method, url, session, kwargs)
+
+        # Determine the enabled log levels once, rather than once per message,
+        # so that disabled messages cost nothing inside the retry loop
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+
         # Wrap requests parameters in a model to make passing them around
         # simpler
         request_parameters = RequestsStampede.models.RequestParameters(
             http_method=http_method,
             url=url,
-            session=self._request_session(),
+            session=session,
             kwargs=kwargs,
         )
 
-        self.logger.info("Attempting to fulfill request: %r", request_parameters)
+        if log_info:
+            self.logger.info("Attempting to fulfill request: %r", request_parameters)
 
         # Construct a sequence of requests that may be transmitted in the event
         # of consecutive request failures
@@ -152,17 +197,24 @@ class RetryRequest(AbstractRetryRequest):
 
         # Begin attempting requests on the desired resource
         for attempt in attempt_sequence.attempts():
+            # Note when the attempt began so that any time spent waiting on a
+            # failed attempt counts towards its backoff delay
+            attempt_started = monotonic()
+
             try:
-                self.logger.debug("Executing request attempt: %r", attempt)
+                if log_debug:
+                    self.logger.debug("Executing request attempt: %r", attempt)
 
                 # Execute request
                 response = attempt.execute()
 
-                self.logger.debug("Request response received: %r", response)
+                if log_debug:
+                    self.logger.debug("Request response received: %r", response)
 
                 # Check response status code
                 if response.ok:
-                    self.logger.info("Request respone successful: %r", response)
+                    if log_info:
+                        self.logger.info("Request respone successful: %r", response)
                     return response
 
                 self.logger.warning("Request response unsuccessful: %r", response)
@@ -173,28 +225,111 @@ class RetryRequest(AbstractRetryRequest):
                 requests.exceptions.RequestException,
                 RequestsStampede.exceptions.UnsuccessfulRequestAttemptException,
             ) as exception:
-                self.logger.info("Caught unsuccessful request attempt: %r", attempt)
-                self.logger.debug("Request exception = %r", exception)
+                if log_info:
+                    self.logger.info("Caught unsuccessful request attempt: %r", attempt)
+                if log_debug:
+                    self.logger.debug("Request exception = %r", exception)
 
-                if attempt.backoff is not None:
-                    self.logger.info(
-                        "Backoff delay enabled, inserting a %r second delay between request "
-                        "attempts",
-                        attempt.backoff,
-                    )
+                self._backoff_delay(attempt, attempt_started, log_info)
 
-                    # Insert backoff delay between request attempts
-                    time.sleep(attempt.backoff)
+        self.logger.error("Unable to fulfill request: %r", request_parameters)
 
-                    self.logger.info(
-                        "Backoff delay complete, proceeding with next request attempt"
-                    )
-                else:
-                    self.logger.info(
-                        "Backoff delay disabled, proceeding immediately with next request attempt"
-                    )
+        return None
 
-        self.logger.error("Unable to fulfill request: %r", request_parameters)
+    def _backoff_delay(
+        self,
+        attempt: RequestsStampede.models.RequestAttempt,
+        attempt_started: float,
+        log_info: bool,
+    ):
+        """
+        Inserts the backoff delay, if any, following an unsuccessful request
+        attempt. The delay is measured from the start of the attempt, such that
+        only its remainder is slept.
+
+        :param attempt: The unsuccessful request attempt.
+        :param attempt_started: The time.monotonic() value at which the
+                                attempt began.
+        :param log_info: Whether INFO level logging is enabled.
+
+        :type attempt: RequestsStampede.models.RequestAttempt
+        :type attempt_started: float
+        :type log_info: bool
+        """
+
+        if attempt.backoff is None:
+            return
+
+        if log_info:
+            self.logger.info(
+                "Backing off %.3fs before retry %d",
+                attempt.backoff,
+                attempt.attempt + 1,
+            )
+
+        # Insert backoff delay between request attempts, less the time already
+        # spent on the failed attempt
+        remaining = attempt.backoff - (monotonic() - attempt_started)
+
+        if remaining > 0.0:
+            sleep(remaining)
+
+    def _single_request_handler(
+        self,
+        http_method: str,
+        url: str,
+        session: requests.Session,
+        kwargs: dict,
+    ) -> requests.Response:
+        """
+        An internal function to transmit the desired HTTP request exactly once,
+        for retry configurations that either disable retries or only permit a
+        single attempt. No attempt sequence or backoff delay is involved.
+
+        :param http_method: The desired HTTP method for the request (i.e. GET).
+        :param url: The desired resource to request.
+        :param session: The requests.Session object to transmit the request.
+        :param kwargs: Additional keyword arguments to be provided to
+                       requests.Request
+
+        :type http_method: str
+        :type url: str
+        :type session: requests.Session
+        :type kwargs: dict
+
+        :return: The request's requests.Response object if successful,
+                 otherwise None.
+        :rtype: requests.Response
+        """
+
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        if log_info:
+            self.logger.info(
+                "Attempting to fulfill single request: %s %s", http_method, url
+            )
+
+        try:
+            prepared = session.prepare_request(
+                requests.Request(http_method, url, **kwargs)
+            )
+            response = session.send(prepared)
+        except requests.exceptions.RequestException as exception:
+            if log_debug:
+                self.logger.debug("Request exception = %r", exception)
+        else:
+            if log_debug:
+                self.logger.debug("Request response received: %r", response)
+
+            if response.ok:
+                if log_info:
+                    self.logger.info("Request respone successful: %r", response)
+                return response
+
+            self.logger.warning("Request response unsuccessful: %r", response)
+
+        self.logger.error("Unable to fulfill request: %s %s", http_method, url)
 
         return None
 
@@ -205,14 +340,25 @@ class RetryRequest(AbstractRetryRequest):
         of the class, the provided session object will be returned; otherwise,
         a new session object will be created for each request.
 
+        New session objects share a single transport adapter, private to this
+        instance, so that connections to a host are kept alive and reused
+        across requests and retry attempts while cookies are not.
+
         :return: A requests.Session object to be used in the fulfillment of an
                  HTTP request.
         :rtype: requests.Session
         """
-        if self.session is None:
-            return requests.Session()
+        if self.session is not None:
+            return self.session
+
+        if self._default_adapter is None:
+            self._default_adapter = requests.adapters.HTTPAdapter()
+
+        session = requests.Session()
+        session.mount("https://", self._default_adapter)
+        session.mount("http://", self._default_adapter)
 
-        return self.session
+        return session
 
     def get(self, url: str, **kwargs) -> requests.Response:
         """
@@ -317,3 +463,274 @@ class RetrySession(RetryRequest):
 
     session = requests.Session()
     logger = module_logger.getChild("RetrySession")
+
+
+class AsyncRetryRequest(AbstractRetryRequest):
+    """
+    The AsyncRetryRequest object is the asyncio counterpart of RetryRequest.
+    Its HTTP method wrappers are coroutines, transmitting requests with an
+    httpx.AsyncClient and awaiting backoff delays with asyncio.sleep(), such
+    that many independent requests (and their retries) may progress
+    concurrently on a single thread.
+
+    The same retry configurations are supported. Keyword arguments are passed
+    through to httpx.AsyncClient.build_request() rather than requests.Request.
+
+    AsyncRetryRequest requires the optional httpx dependency:
+
+    pip install RequestsStampede[async]
+    """
+
+    retry_config = None
+    session = None
+    logger = module_logger.getChild("AsyncRetryRequest")
+
+    def __init__(
+        self,
+        retry_config: typing.Optional[
+            RequestsStampede.config.AbstractRetryConfig
+        ] = None,
+        session: typing.Optional["httpx.AsyncClient"] = None,
+    ):
+        """
+        Default constructor for the asyncio RequestsStampede wrapper.
+
+        :param retry_config: The retry configuration that AsyncRetryRequest
+                             shall comply with.
+        :param session: An httpx.AsyncClient object that shall be shared among
+                        all transmitted HTTP requests. If omitted, a client
+                        will be created on first use and closed by aclose().
+
+        :type retry_config: RequestsStampede.config.AbstractRetryConfig
+        :type session: httpx.AsyncClient
+        """
+
+        try:
+            import httpx  # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError as exception:
+            raise ImportError(
+                "AsyncRetryRequest requires httpx: pip install RequestsStampede[async]"
+            ) from exception
+
+        super().__init__(retry_config=retry_config, session=session)
+
+        self._default_session = None
+
+    async def _request_handler(
+        self, http_method: str, url: str, kwargs: dict
+    ) -> "httpx.Response":
+        """
+        An internal coroutine to make a best-effort attempt at transmitting the
+        desired HTTP request in compliance with the established retry
+        configuration. See RetryRequest._request_handler() for details.
+
+        :param http_method: The desired HTTP method for the request (i.e. GET).
+        :param url: The desired resource to request.
+        :param kwargs: Additional keyword arguments to be provided to
+                       httpx.AsyncClient.build_request()
+
+        :type http_method: str
+        :type url: str
+        :type kwargs: dict
+
+        :return: Upon the first successful request, its httpx.Response object
+                 will be returned. If all request attempts are unsuccessful,
+                 None will be returned.
+        :rtype: httpx.Response
+        """
+
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        session = self._request_session()
+
+        # Determine the enabled log levels once, see
+        # RetryRequest._request_handler()
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        request_parameters = RequestsStampede.models.RequestParameters(
+            http_method=http_method,
+            url=url,
+            session=session,
+            kwargs=kwargs,
+        )
+
+        if log_info:
+            self.logger.info("Attempting to fulfill request: %r", request_parameters)
+
+        attempt_sequence = RequestsStampede.models.RequestAttemptSequence(
+            request_parameters,
+            self.retry_config,
+            prepare=functools.partial(
+                session.build_request, http_method, url, **kwargs
+            ),
+        )
+
+        for attempt in attempt_sequence.attempts():
+            attempt_started = monotonic()
+
+            try:
+                if log_debug:
+                    self.logger.debug("Executing request attempt: %r", attempt)
+
+                response = await attempt.execute_async()
+
+                if log_debug:
+                    self.logger.debug("Request response received: %r", response)
+
+                if not response.is_error:
+                    if log_info:
+                        self.logger.info("Request respone successful: %r", response)
+                    return response
+
+                self.logger.warning("Request response unsuccessful: %r", response)
+            except httpx.HTTPError as exception:
+                if log_info:
+                    self.logger.info("Caught unsuccessful request attempt: %r", attempt)
+                if log_debug:
+                    self.logger.debug("Request exception = %r", exception)
+
+            if attempt.backoff is not None:
+                if log_info:
+                    self.logger.info(
+                        "Backing off %.3fs before retry %d",
+                        attempt.backoff,
+                        attempt.attempt + 1,
+                    )
+
+                # Await the backoff delay, less the time already spent on the
+                # failed attempt
+                remaining = attempt.backoff - (monotonic() - attempt_started)
+
+                if remaining > 0.0:
+                    await _async_sleep(remaining)
+
+        self.logger.error("Unable to fulfill request: %r", request_parameters)
+
+        return None
+
+    def _request_session(self) -> "httpx.AsyncClient":
+        """
+        Returns the httpx.AsyncClient object provided during the construction
+        of the class or, if none was provided, a client private to this
+        instance that is created on first use.
+
+        :return: An httpx.AsyncClient object to be used in the fulfillment of
+                 an HTTP request.
+        :rtype: httpx.AsyncClient
+        """
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        if self.session is not None:
+            return self.session
+
+        if self._default_session is None:
+            self._default_session = httpx.AsyncClient()
+
+        return self._default_session
+
+    async def aclose(self):
+        """
+        Closes the httpx.AsyncClient created by this instance, if any. A client
+        provided during construction is left to its owner to close.
+        """
+        if self._default_session is not None:
+            await self._default_session.aclose()
+            self._default_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def get(self, url: str, **kwargs) -> "httpx.Response":
+        """
+        An asyncio wrapper for an HTTP GET request.
+
+        :param url: URL of the resource to request
+
+        :type url: str
+
+        :return: Request response object.
+        :rtype: httpx.Response
+        """
+        return await self._request_handler("GET", url, kwargs)
+
+    async def options(self, url: str, **kwargs) -> "httpx.Response":
+        """
+        An asyncio wrapper for an HTTP OPTIONS request.
+
+        :param url: URL of the resource to request
+
+        :type url: str
+
+        :return: Request response object.
+        :rtype: httpx.Response
+        """
+        return await self._request_handler("OPTIONS", url, kwargs)
+
+    async def head(self, url: str, **kwargs) -> "httpx.Response":
+        """
+        An asyncio wrapper for an HTTP HEAD request.
+
+        :param url: URL of the resource to request
+
+        :type url: str
+
+        :return: Request response object.
+        :rtype: httpx.Response
+        """
+        return await self._request_handler("HEAD", url, kwargs)
+
+    async def post(self, url: str, **kwargs) -> "httpx.Response":
+        """
+        An asyncio wrapper for an HTTP POST request.
+
+        :param url: URL of the resource to request
+
+        :type url: str
+
+        :return: Request response object.
+        :rtype: httpx.Response
+        """
+        return await self._request_handler("POST", url, kwargs)
+
+    async def put(self, url: str, **kwargs) -> "httpx.Response":
+        """
+        An asyncio wrapper for an HTTP PUT request.
+
+        :param url: URL of the resource to request
+
+        :type url: str
+
+        :return: Request response object.
+        :rtype: httpx.Response
+        """
+        return await self._request_handler("PUT", url, kwargs)
+
+    async def patch(self, url: str, **kwargs) -> "httpx.Response":
+        """
+        An asyncio wrapper for an HTTP PATCH request.
+
+        :param url: URL of the resource to request
+
+        :type url: str
+
+        :return: Request response object.
+        :rtype: httpx.Response
+        """
+        return await self._request_handler("PATCH", url, kwargs)
+
+    async def delete(self, url: str, **kwargs) -> "httpx.Response":
+        """
+        An asyncio wrapper for an HTTP DELETE request.
+
+        :param url: URL of the resource to request
+
+        :type url: str
+
+        :return: Request response object.
+        :rtype: httpx.Response
+        """
+        return await self._request_handler("DELETE", url, kwargs)
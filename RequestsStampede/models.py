@@ -3,9 +3,11 @@ Internal models used within the RequestsStampede package.
 """
 
 
+import math
 import typing
+import functools
 import logging
-import math
+import itertools
 
 import requests
 import requests.exceptions
@@ -24,6 +26,8 @@ class RequestParameters:
     RetryRequest or RetrySession classes,
     """
 
+    __slots__ = ("http_method", "url", "session", "kwargs")
+
     http_method: str
     url: str
     session: requests.Session
@@ -52,14 +56,11 @@ class RequestParameters:
         self.kwargs = kwargs
 
     def __repr__(self):
-        return "<{}.{} object at {} http_method={} url={} session={} kwargs={}>".format(
-            __class__.__module__,
-            __class__.__name__,
-            hex(id(self)),
-            self.http_method,
-            self.url,
-            self.session,
-            self.kwargs,
+        cls = type(self)
+        return (
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"http_method={self.http_method} url={self.url} "
+            f"session={self.session} kwargs={self.kwargs}>"
         )
 
 
@@ -71,28 +72,89 @@ class RequestAttemptSequence:
     (i.e. retry attempts, backoff delay, etc).
     """
 
+    __slots__ = (
+        "request_parameters",
+        "retry_config",
+        "_prepare",
+        "_attempts_maximum",
+        "_backoffs",
+        "_attempts_impl",
+    )
+
     request_parameters: RequestParameters
     retry_config: RequestsStampede.config.AbstractRetryConfig
 
+    _prepare: typing.Callable[[], typing.Any]
+    _attempts_maximum: int
+    _backoffs: typing.Sequence[float]
+    _attempts_impl: typing.Callable
+
+    # The number of backoff delays drawn up front for a finite retry policy.
+    # Most requests succeed within the first few attempts, so any further
+    # delays are only drawn lazily, once they are needed.
+    _PRECOMPUTED_BACKOFFS_MAXIMUM = 32
+
     def __init__(
         self,
         request_parameters: RequestParameters,
         retry_config: RequestsStampede.config.AbstractRetryConfig,
+        prepare: typing.Optional[typing.Callable[[], typing.Any]] = None,
     ):
         """
         A basic constructor for parameters that will be necessary to generate
         an iterable sequence of RequestAttempt objects.
 
+        The retry configuration is also examined once, here, to select one of
+        the specialized attempt generators below; the generators themselves do
+        not branch on the configuration.
+
         :param request_parameters: Parameters detailing the desired request.
         :param retry_config: The retry configuration to be followed when
                              generating a request sequence.
+        :param prepare: A callable returning a newly prepared request,
+                        suitable for the request parameters' session send()
+                        method, that each attempt invokes when executed. If
+                        omitted, the request parameters are prepared by
+                        prepare_request().
 
         :type request_parameters: RequestsStampede.models.RequestParameters
         :type retry_config: RequestsStampede.config.AbstractRetryConfig
+        :type prepare: typing.Callable[[], typing.Any]
         """
 
+        if prepare is None:
+            prepare = functools.partial(prepare_request, request_parameters)
+
         self.request_parameters = request_parameters
         self.retry_config = retry_config
+        self._prepare = prepare
+
+        attempts_maximum = retry_config.retry_policy.attempts
+
+        # Retry policies predating is_infinite signal an infinite number of
+        # attempts with math.inf
+        infinite = retry_config.retry_policy.is_infinite or math.isinf(attempts_maximum)
+
+        # If request retry attempts are disabled, only the initial attempt is
+        # made
+        if not retry_config.retry_enabled:
+            attempts_maximum = 1
+            infinite = False
+
+        self._attempts_maximum = attempts_maximum
+        self._attempts_impl = self._ATTEMPT_GENERATORS[
+            (retry_config.backoff_enabled, infinite)
+        ]
+
+        # For finite retry policies, the backoff delays are known up front and
+        # the leading delays are drawn once here: one per attempt, except the
+        # final attempt
+        self._backoffs = ()
+
+        if retry_config.backoff_enabled and not infinite:
+            self._backoffs = retry_config.backoff_policy.as_array(
+                min(attempts_maximum - 1, self._PRECOMPUTED_BACKOFFS_MAXIMUM)
+            )
 
     def attempts(self) -> typing.Iterator:
         """
@@ -103,75 +165,82 @@ class RequestAttemptSequence:
                  compliance to the provided retry configuration.
         :rtype: Generator[RequestsStampede.models.RequestAttempt]
         """
+        return self._attempts_impl(self)
+
+    def _finite_backoff_attempts(self) -> typing.Iterator:
+        """
+        Yields a finite number of attempts, each but the last followed by one
+        of the precomputed backoff delays, or by a delay drawn from the backoff
+        policy once the precomputed delays are exhausted.
+        """
+        request_parameters = self.request_parameters
+        prepare = self._prepare
+        backoffs = self._backoffs
+        attempts_maximum = self._attempts_maximum
+
+        if len(backoffs) < attempts_maximum - 1:
+            backoffs = itertools.chain(
+                backoffs,
+                itertools.islice(
+                    self.retry_config.backoff_policy.delay(),
+                    len(backoffs),
+                    attempts_maximum - 1,
+                ),
+            )
+
+        for attempt_num, backoff in enumerate(backoffs, 1):
+            yield RequestAttempt(request_parameters, attempt_num, backoff, prepare)
+
+        # The final attempt is not followed by a backoff delay
+        yield RequestAttempt(request_parameters, attempts_maximum, None, prepare)
+
+    def _finite_attempts(self) -> typing.Iterator:
+        """
+        Yields a finite number of attempts without backoff delays.
+        """
+        request_parameters = self.request_parameters
+        prepare = self._prepare
+
+        for attempt_num in range(1, self._attempts_maximum + 1):
+            yield RequestAttempt(request_parameters, attempt_num, None, prepare)
+
+    def _infinite_backoff_attempts(self) -> typing.Iterator:
+        """
+        Yields attempts indefinitely, each followed by the next delay of the
+        backoff policy.
+        """
+        request_parameters = self.request_parameters
+        prepare = self._prepare
+
+        for attempt_num, backoff in zip(
+            itertools.count(1), self.retry_config.backoff_policy.delay()
+        ):
+            yield RequestAttempt(request_parameters, attempt_num, backoff, prepare)
+
+    def _infinite_attempts(self) -> typing.Iterator:
+        """
+        Yields attempts indefinitely without backoff delays.
+        """
+        request_parameters = self.request_parameters
+        prepare = self._prepare
+
+        for attempt_num in itertools.count(1):
+            yield RequestAttempt(request_parameters, attempt_num, None, prepare)
 
-        attempts_maximum = self.retry_config.retry_policy.attempts
-        backoff_generator = self.retry_config.backoff_policy.delay()
-
-        def __attempt_generator(attempt_num: int):
-            """
-            Generates a RequestAttempt object in compliance with the parent
-            instance's retry configuration and policies.
-
-            :param attempt_num: The request attempt's position with respect to
-                                all prior attempts. Starting at 1 and
-                                increasing.
-
-            :type attempt_num: int
-
-            :return: A request attempt object to be executed
-            :rtype: RequestsStampede.models.RequestAttempt
-            """
-            backoff = None
-
-            # If request retry attempts are disabled, do not return anything.
-            # This case will be caught below and used to terminate the
-            # generator
-            if not self.retry_config.retry_enabled:
-                return None
-
-            # Likewise, if backoff delays are enabled and the request attempt
-            # is below the maximum number of request retries (math.inf if
-            # infinite), then we will fetch the backoff delay from the backoff
-            # generator
-            if self.retry_config.backoff_enabled:
-                if attempt_num < attempts_maximum:
-                    backoff = next(backoff_generator)
-
-            return RequestAttempt(self.request_parameters, attempt_num, backoff)
-
-        # If the RequestsStampede.policy.retry.InfiniteRetryPolicy is used, the
-        # generator will continue forever
-        if attempts_maximum == math.inf:
-            attempt_num = 1
-            while True:
-                attempt = __attempt_generator(attempt_num)
-
-                # Catch instances where retry_enabled may be disabled in the
-                # configuration
-                if attempt is None:
-                    return
-
-                yield attempt
-                attempt_num += 1
-        else:
-            # Otherwise, the maximum number of attempts is finite.
-            for attempt_num in range(1, attempts_maximum + 1):
-                attempt = __attempt_generator(attempt_num)
-
-                # Catch instances where retry_enabled may be disabled in the
-                # configuration
-                if attempt is None:
-                    return
-
-                yield attempt
+    # Attempt generators keyed by (backoff enabled, infinite retry policy)
+    _ATTEMPT_GENERATORS = {
+        (True, False): _finite_backoff_attempts,
+        (False, False): _finite_attempts,
+        (True, True): _infinite_backoff_attempts,
+        (False, True): _infinite_attempts,
+    }
 
     def __repr__(self):
-        return "<{}.{} object at {} request_parameters={} retry_config={}>".format(
-            __class__.__module__,
-            __class__.__name__,
-            hex(id(self)),
-            self.request_parameters,
-            self.retry_config,
+        cls = type(self)
+        return (
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"request_parameters={self.request_parameters} "
+            f"retry_config={self.retry_config}>"
         )
 
 
@@ -181,12 +250,25 @@ class RequestAttempt:
     execution. The RequestAttempt class contains all the information necessary
     to execute a request, including the request parameters as well as useful
     metadata such as the attempt number and desired backoff delay. When
-    executed, the class will store the request's response.
+    executed, the class will prepare the request and store the request's
+    response.
 
     TODO - Add response time monitoring.
     """
 
-    request: requests.Request
+    __slots__ = (
+        "request_parameters",
+        "prepare",
+        "prepared",
+        "session",
+        "response",
+        "attempt",
+        "backoff",
+    )
+
+    request_parameters: RequestParameters
+    prepare: typing.Callable[[], typing.Any]
+    prepared: requests.PreparedRequest
     session: requests.Session
     response: requests.Response
 
@@ -198,6 +280,7 @@ class RequestAttempt:
         request_parameters: RequestParameters,
         attempt: typing.Optional[int] = None,
         backoff: typing.Optional[float] = None,
+        prepare: typing.Optional[typing.Callable[[], typing.Any]] = None,
     ):
         """
         A basic constructor.
@@ -205,19 +288,23 @@ class RequestAttempt:
         :param request_parameters: The potential request to be executed.
         :param attempt: The request's attempt number.
         :param backoff: The desired request backoff delay.
+        :param prepare: A callable returning the prepared request to transmit,
+                        invoked when the attempt is executed. If omitted, the
+                        request parameters are prepared by prepare_request().
 
         :type request_parameters: RequestsStampede.models.RequestParameters
         :type attempt: int
         :type backoff: float
+        :type prepare: typing.Callable[[], typing.Any]
         """
 
         self.request_parameters = request_parameters
 
-        self.request = requests.Request(
-            request_parameters.http_method,
-            request_parameters.url,
-            **request_parameters.kwargs
-        )
+        if prepare is None:
+            prepare = functools.partial(prepare_request, request_parameters)
+
+        self.prepare = prepare
+        self.prepared = None
 
         self.session = request_parameters.session
         self.response = None
@@ -227,31 +314,68 @@ class RequestAttempt:
 
     def execute(self) -> requests.Response:
         """
-        Executes the request attempt.
+        Prepares and executes the request attempt. The request is prepared
+        here, rather than ahead of time, such that cookies the session received
+        from previous attempts and authentication handlers apply, and such that
+        a request that cannot be prepared fails like any other attempt.
 
         :return: The request's response.
         :rtype: requests.Response
         """
 
-        prepared_request = self.session.prepare_request(self.request)
+        self.prepared = self.prepare()
 
-        response = self.session.send(prepared_request)
+        response = self.session.send(self.prepared)
+
+        self.response = response
+
+        return response
+
+    async def execute_async(self):
+        """
+        Prepares and executes the request attempt using an asynchronous
+        session, such as an httpx.AsyncClient, whose send() method must be
+        awaited.
+
+        :return: The request's response.
+        :rtype: httpx.Response
+        """
+
+        self.prepared = self.prepare()
+
+        response = await self.session.send(self.prepared)
 
         self.response = response
 
         return response
 
     def __repr__(self):
+        cls = type(self)
         return (
-            "<{}.{} object at {} request={} session={} response={} attempt={} "
-            "backoff={}>"
-        ).format(
-            __class__.__module__,
-            __class__.__name__,
-            hex(id(self)),
-            self.request,
-            self.session,
-            self.response,
-            self.attempt,
-            self.backoff,
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"prepared={self.prepared} session={self.session} "
+            f"response={self.response} attempt={self.attempt} "
+            f"backoff={self.backoff}>"
         )
+
+
+def prepare_request(request_parameters: RequestParameters) -> requests.PreparedRequest:
+    """
+    Builds and prepares (i.e. encodes parameters, headers, body, and cookies) a
+    request from the provided request parameters using its session.
+
+    :param request_parameters: Parameters detailing the desired request.
+
+    :type request_parameters: RequestsStampede.models.RequestParameters
+
+    :return: A request ready to be transmitted by the session.
+    :rtype: requests.PreparedRequest
+    """
+
+    request = requests.Request(
+        request_parameters.http_method,
+        request_parameters.url,
+        **request_parameters.kwargs
+    )
+
+    return request_parameters.session.prepare_request(request)
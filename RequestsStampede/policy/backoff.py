@@ -4,8 +4,12 @@ Built-in backoff policies and their abstract class.
 
 
 import abc
+import array
+import math
 import typing
 import random
+import itertools
+import functools
 
 import RequestsStampede.exceptions
 
@@ -15,6 +19,12 @@ class AbstractBackoffPolicy(abc.ABC):
     An abstract class for use in implementing backoff policies.
     """
 
+    __slots__ = ()
+
+    # Each policy's representation is built once, by its constructor, as its
+    # parameters are not expected to change afterwards
+    _repr: str
+
     @abc.abstractmethod
     def delay(self) -> typing.Iterable[float]:
         """
@@ -23,16 +33,64 @@ class AbstractBackoffPolicy(abc.ABC):
         are the desired backoff delay, measured in seconds, to be added after
         an unsuccessful request attempt.
 
+        Every call must return a new, independent, iterable: policies are
+        shared between requests (and threads) by way of the default retry
+        configurations, so each request's backoff delays start from the
+        beginning of the sequence.
+
         :return: A generator of floats.
         :rtype: typing.Iterable[float]
         """
 
+    def as_array(self, n: int) -> array.array:
+        """
+        Returns the first n backoff delays of a new delay generator, computed
+        up front, as a compact array of floats.
+
+        :param n: The number of backoff delays to compute.
+
+        :type n: int
+
+        :return: An array of n floats.
+        :rtype: array.array
+        """
+        return array.array("d", itertools.islice(self.delay(), n))
+
+
+def _float_parameter(name: str, value: typing.Any) -> float:
+    """
+    Validates that a backoff policy parameter, i.e. a delay measured in
+    seconds, is a finite real number.
+
+    :param name: The parameter's name, used in the raised exception.
+    :param value: The parameter's value.
+
+    :type name: str
+    :type value: typing.Any
+
+    :return: The parameter's value, as a float.
+    :rtype: float
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"{name} must be a float, not {type(value).__name__}")
+
+    # An infinite or NaN delay could never be slept, and would never terminate
+    # the precomputation of a growing delay sequence
+    if not math.isfinite(value):
+        raise ValueError(f"{name} must be finite")
+
+    return float(value)
+
 
 class FixedBackoffPolicy(AbstractBackoffPolicy):
     """
     Establishes constant backoff delay.
     """
 
+    __slots__ = ("constant_delay", "_repr")
+
+    constant_delay: float
+
     def __init__(self, delay: typing.Optional[float] = 5.0):
         """
         A basic constructor.
@@ -42,11 +100,19 @@ class FixedBackoffPolicy(AbstractBackoffPolicy):
 
         :type delay: float
         """
-        assert isinstance(delay, float)
-        assert delay >= 0.0
+        delay = _float_parameter("delay", delay)
+
+        if delay < 0.0:
+            raise ValueError("delay must not be negative")
 
         self.constant_delay = delay
 
+        cls = type(self)
+        self._repr = (
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"constant_delay={self.constant_delay}>"
+        )
+
     def delay(self) -> typing.Iterable[float]:
         """
         Returns the backoff delay generator.
@@ -54,16 +120,24 @@ class FixedBackoffPolicy(AbstractBackoffPolicy):
         :return: A generator of floats.
         :rtype: typing.Iterable[float]
         """
-        while True:
-            yield self.constant_delay
+        return itertools.repeat(self.constant_delay)
+
+    def as_array(self, n: int) -> array.array:
+        """
+        Returns n backoff delays, computed up front, as a compact array of
+        floats.
+
+        :param n: The number of backoff delays to compute.
+
+        :type n: int
+
+        :return: An array of n floats.
+        :rtype: array.array
+        """
+        return array.array("d", (self.constant_delay,)) * n
 
     def __repr__(self):
-        return "<{}.{} object at {} constant_delay={}>".format(
-            __class__.__module__,
-            __class__.__name__,
-            hex(id(self)),
-            self.constant_delay,
-        )
+        return self._repr
 
 
 class RandomBackoffPolicy(AbstractBackoffPolicy):
@@ -72,6 +146,11 @@ class RandomBackoffPolicy(AbstractBackoffPolicy):
     values.
     """
 
+    __slots__ = ("minimum_delay", "maximum_delay", "_repr")
+
+    minimum_delay: float
+    maximum_delay: float
+
     def __init__(
         self,
         minimum_delay: typing.Optional[float] = 3.0,
@@ -86,33 +165,110 @@ class RandomBackoffPolicy(AbstractBackoffPolicy):
         :type minimum_delay: float
         :type maximum_delay: float
         """
-        assert isinstance(minimum_delay, float)
-        assert isinstance(maximum_delay, float)
-        assert minimum_delay >= 0.0
-        assert maximum_delay > minimum_delay
+        minimum_delay = _float_parameter("minimum_delay", minimum_delay)
+        maximum_delay = _float_parameter("maximum_delay", maximum_delay)
+
+        if minimum_delay < 0.0:
+            raise ValueError("minimum_delay must not be negative")
+
+        if maximum_delay <= minimum_delay:
+            raise ValueError("maximum_delay must be greater than minimum_delay")
 
         self.minimum_delay = minimum_delay
         self.maximum_delay = maximum_delay
 
-    def delay(self) -> typing.Iterable[float]:
+        cls = type(self)
+        self._repr = (
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"minimum_delay={self.minimum_delay} "
+            f"maximum_delay={self.maximum_delay}>"
+        )
+
+    def delay(
+        self, rng: typing.Optional[random.Random] = None
+    ) -> typing.Iterable[float]:
         """
         Returns the backoff delay generator.
 
+        :param rng: An optional random number generator to draw the delays
+            from, such as a seeded random.Random instance. The random module's
+            shared generator is used by default.
+
+        :type rng: typing.Optional[random.Random]
+
         :return: A generator of floats.
         :rtype: typing.Iterable[float]
         """
+        # Equivalent to random.uniform(), without its per-call function frame
+        # and attribute lookups
+        rand = (rng or random).random
+        minimum_delay = self.minimum_delay
+        delay_range = self.maximum_delay - self.minimum_delay
+
+        # Without a lower bound, the offset addition is unnecessary
+        if minimum_delay == 0.0:
+            while True:
+                yield delay_range * rand()
+
         while True:
-            yield random.uniform(self.minimum_delay, self.maximum_delay)
+            yield minimum_delay + delay_range * rand()
 
-    def __repr__(self):
-        return "<{}.{} object at {} minimum_delay={} maximum_delay={}>".format(
-            __class__.__module__,
-            __class__.__name__,
-            hex(id(self)),
-            self.minimum_delay,
-            self.maximum_delay,
+    def as_array(
+        self, n: int, rng: typing.Optional[random.Random] = None
+    ) -> array.array:
+        """
+        Returns n random backoff delays, drawn up front, as a compact array of
+        floats.
+
+        :param n: The number of backoff delays to draw.
+        :param rng: An optional random number generator to draw the delays
+            from, see delay().
+
+        :type n: int
+        :type rng: typing.Optional[random.Random]
+
+        :return: An array of n floats.
+        :rtype: array.array
+        """
+        rand = (rng or random).random
+        minimum_delay = self.minimum_delay
+        delay_range = self.maximum_delay - self.minimum_delay
+
+        return array.array(
+            "d", [minimum_delay + delay_range * rand() for _ in range(n)]
         )
 
+    def __repr__(self):
+        return self._repr
+
+
+@functools.lru_cache(maxsize=32)
+def _fibonacci_prefix(initial_delay: float, maximum_delay: float) -> array.array:
+    """
+    Computes the psuedo-fibonacci sequence beginning with the initial delay,
+    up to and including the maximum delay. Policies sharing the same
+    parameters share the same sequence, which must not be modified.
+
+    :param initial_delay: The initial digit of the sequence.
+    :param maximum_delay: The maximum permissible delay.
+
+    :type initial_delay: float
+    :type maximum_delay: float
+
+    :return: The sequence's terms that do not exceed the maximum delay.
+    :rtype: array.array
+    """
+    prefix = array.array("d")
+
+    fib_curr = initial_delay
+    fib_next = initial_delay + 1.0
+
+    while fib_curr <= maximum_delay:
+        prefix.append(fib_curr)
+        fib_curr, fib_next = fib_next, fib_curr + fib_next
+
+    return prefix
+
 
 class FibonacciBackoffPolicy(AbstractBackoffPolicy):
     """
@@ -121,8 +277,12 @@ class FibonacciBackoffPolicy(AbstractBackoffPolicy):
     fail.
     """
 
-    initial_delay: float
-    maximum_delay: float
+    __slots__ = ("_initial_delay", "_maximum_delay", "_prefix", "_repr")
+
+    _initial_delay: float
+    _maximum_delay: float
+
+    _prefix: array.array
 
     def __init__(
         self,
@@ -142,12 +302,48 @@ class FibonacciBackoffPolicy(AbstractBackoffPolicy):
         :type initial_delay: float
         :type maximum_delay: float
         """
-        assert isinstance(initial_delay, float)
-        assert isinstance(maximum_delay, float)
-        assert maximum_delay > initial_delay
+        initial_delay = _float_parameter("initial_delay", initial_delay)
+        maximum_delay = _float_parameter("maximum_delay", maximum_delay)
 
-        self.initial_delay = initial_delay
-        self.maximum_delay = maximum_delay
+        if initial_delay < 0.0:
+            raise ValueError("initial_delay must not be negative")
+
+        if maximum_delay <= initial_delay:
+            raise ValueError("maximum_delay must be greater than initial_delay")
+
+        # The delays are read-only, as the sequence and representation computed
+        # from them below are not recomputed
+        self._initial_delay = initial_delay
+        self._maximum_delay = maximum_delay
+
+        # The sequence is identical for every generator, and constant once it
+        # exceeds the maximum delay, so its growing prefix is computed once
+        self._prefix = _fibonacci_prefix(initial_delay, maximum_delay)
+
+        cls = type(self)
+        self._repr = (
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"initial_delay={self.initial_delay} "
+            f"maximum_delay={self.maximum_delay}>"
+        )
+
+    @property
+    def initial_delay(self) -> float:
+        """
+        The initial digit of the psuedo-fibonacci sequence.
+
+        :rtype: float
+        """
+        return self._initial_delay
+
+    @property
+    def maximum_delay(self) -> float:
+        """
+        The maximum permissible delay.
+
+        :rtype: float
+        """
+        return self._maximum_delay
 
     def delay(self) -> typing.Iterable[float]:
         """
@@ -156,35 +352,239 @@ class FibonacciBackoffPolicy(AbstractBackoffPolicy):
         :return: A generator of floats.
         :rtype: typing.Iterable[float]
         """
-        fib_curr = self.initial_delay
-        fib_next = self.initial_delay + 1.0
+        return itertools.chain(self._prefix, itertools.repeat(self.maximum_delay))
 
-        while True:
-            if fib_curr <= self.maximum_delay:
-                yield fib_curr
-            else:
-                yield self.maximum_delay
+    def as_array(self, n: int) -> array.array:
+        """
+        Returns the first n backoff delays, computed up front, as a compact
+        array of floats.
 
-            # Increment Sequence
-            tmp = fib_curr
-            fib_curr = fib_next
-            fib_next += tmp
+        :param n: The number of backoff delays to compute.
+
+        :type n: int
+
+        :return: An array of n floats.
+        :rtype: array.array
+        """
+        delays = self._prefix[:n]
+        delays.extend(itertools.repeat(self.maximum_delay, n - len(delays)))
+
+        return delays
 
     def __repr__(self):
-        return "<{}.{} object at {} initial_delay={} maximum_delay={}>".format(
-            __class__.__module__,
-            __class__.__name__,
-            hex(id(self)),
-            self.initial_delay,
-            self.maximum_delay,
+        return self._repr
+
+
+@functools.lru_cache(maxsize=32)
+def _exponential_prefix(
+    initial_delay: float, maximum_delay: float, factor: float
+) -> array.array:
+    """
+    Computes the exponential sequence beginning with the initial delay, up to
+    and including the maximum delay. Policies sharing the same parameters share
+    the same sequence, which must not be modified.
+
+    :param initial_delay: The initial term of the sequence.
+    :param maximum_delay: The maximum permissible delay.
+    :param factor: The ratio between consecutive terms of the sequence.
+
+    :type initial_delay: float
+    :type maximum_delay: float
+    :type factor: float
+
+    :return: The sequence's terms that do not exceed the maximum delay.
+    :rtype: array.array
+    """
+    prefix = array.array("d")
+
+    exp_curr = initial_delay
+
+    while exp_curr <= maximum_delay:
+        prefix.append(exp_curr)
+        exp_curr *= factor
+
+    return prefix
+
+
+class ExponentialBackoffPolicy(AbstractBackoffPolicy):
+    """
+    Establishes an exponential backoff delay that grows, to a configurable
+    upper bound, as consecutive request attempts fail. Each delay is randomly
+    scaled (jittered) so that clients which failed together do not retry
+    together.
+    """
+
+    __slots__ = (
+        "_initial_delay",
+        "_maximum_delay",
+        "_factor",
+        "_jitter",
+        "_prefix",
+        "_repr",
+    )
+
+    _initial_delay: float
+    _maximum_delay: float
+    _factor: float
+    _jitter: float
+
+    _prefix: array.array
+
+    def __init__(
+        self,
+        initial_delay: typing.Optional[float] = 1.0,
+        maximum_delay: typing.Optional[float] = 120.0,
+        factor: typing.Optional[float] = 2.0,
+        jitter: typing.Optional[float] = 0.5,
+    ):
+        """
+        A basic constructor.
+
+        :param initial_delay: The first delay of the exponential sequence. For
+                              example, an initial delay of 3 and a factor of 2
+                              would result in a sequence of: 3, 6, 12, 24, etc.
+        :param maximum_delay: The maximum permissible delay, prior to jitter.
+                              If the sequence goes beyond this value, the
+                              maximum delay is used instead.
+        :param factor: The ratio between consecutive delays.
+        :param jitter: The fraction by which each delay is randomly scaled up
+                       or down. For example, a jitter of 0.5 results in delays
+                       between 50% and 150% of the sequence's value. A jitter
+                       of 0 disables jitter.
+
+        :type initial_delay: float
+        :type maximum_delay: float
+        :type factor: float
+        :type jitter: float
+        """
+        initial_delay = _float_parameter("initial_delay", initial_delay)
+        maximum_delay = _float_parameter("maximum_delay", maximum_delay)
+        factor = _float_parameter("factor", factor)
+        jitter = _float_parameter("jitter", jitter)
+
+        if initial_delay <= 0.0:
+            raise ValueError("initial_delay must be positive")
+
+        if maximum_delay <= initial_delay:
+            raise ValueError("maximum_delay must be greater than initial_delay")
+
+        if factor <= 1.0:
+            raise ValueError("factor must be greater than 1")
+
+        if not 0.0 <= jitter < 1.0:
+            raise ValueError("jitter must be at least 0 and less than 1")
+
+        # The parameters are read-only, see FibonacciBackoffPolicy
+        self._initial_delay = initial_delay
+        self._maximum_delay = maximum_delay
+        self._factor = factor
+        self._jitter = jitter
+
+        self._prefix = _exponential_prefix(initial_delay, maximum_delay, factor)
+
+        cls = type(self)
+        self._repr = (
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"initial_delay={self.initial_delay} "
+            f"maximum_delay={self.maximum_delay} factor={self.factor} "
+            f"jitter={self.jitter}>"
         )
 
+    @property
+    def initial_delay(self) -> float:
+        """
+        The first delay of the exponential sequence.
+
+        :rtype: float
+        """
+        return self._initial_delay
+
+    @property
+    def maximum_delay(self) -> float:
+        """
+        The maximum permissible delay, prior to jitter.
+
+        :rtype: float
+        """
+        return self._maximum_delay
+
+    @property
+    def factor(self) -> float:
+        """
+        The ratio between consecutive delays.
+
+        :rtype: float
+        """
+        return self._factor
+
+    @property
+    def jitter(self) -> float:
+        """
+        The fraction by which each delay is randomly scaled up or down.
+
+        :rtype: float
+        """
+        return self._jitter
+
+    def delay(self) -> typing.Iterable[float]:
+        """
+        Returns the backoff delay generator.
+
+        :return: A generator of floats.
+        :rtype: typing.Iterable[float]
+        """
+        delays = itertools.chain(self._prefix, itertools.repeat(self.maximum_delay))
+
+        if self.jitter == 0.0:
+            return delays
+
+        return self._jittered(delays)
+
+    def _jittered(self, delays: typing.Iterable[float]) -> typing.Iterable[float]:
+        """
+        Randomly scales each of the provided delays by up to the policy's
+        jitter, in either direction.
+
+        :param delays: The delays to be jittered.
+
+        :type delays: typing.Iterable[float]
+
+        :return: A generator of floats.
+        :rtype: typing.Iterable[float]
+        """
+        rand = random.random
+        scale_minimum = 1.0 - self.jitter
+        scale_range = 2.0 * self.jitter
+
+        for delay in delays:
+            yield delay * (scale_minimum + scale_range * rand())
+
+    def __repr__(self):
+        return self._repr
+
+
+# Custom backoff policy types, mapped to the built-in policy class they
+# construct, the delay parameters that policy class is given, and any optional
+# parameters that are passed along when present
+_CUSTOM_BACKOFF_POLICIES = {
+    "fixed": (FixedBackoffPolicy, ("delay",), ()),
+    "random": (RandomBackoffPolicy, ("minimum_delay", "maximum_delay"), ()),
+    "fibonacci": (FibonacciBackoffPolicy, ("initial_delay", "maximum_delay"), ()),
+    "exponential": (
+        ExponentialBackoffPolicy,
+        ("initial_delay", "maximum_delay"),
+        ("factor", "jitter"),
+    ),
+}
+
 
 class CustomBackoffPolicy(AbstractBackoffPolicy):
     """
     Establishes a custom file-based backoff policy.
     """
 
+    __slots__ = ("_policy", "_repr")
+
     _policy: AbstractBackoffPolicy
 
     def __init__(self, policy: dict):
@@ -211,51 +611,59 @@ class CustomBackoffPolicy(AbstractBackoffPolicy):
             "maximum_delay": 90.0
         }
 
+        {
+            "type": "exponential",
+            "initial_delay": 1.0,
+            "maximum_delay": 60.0,
+            "factor": 2.0,
+            "jitter": 0.5
+        }
+
         :param policy:
 
         :type policy:
         """
 
-        policy_type = policy.get("type").lower()
-
-        if policy_type == "fixed":
-            delay = policy.get("delay")
-
-            assert isinstance(delay, float)
+        policy_type = policy.get("type")
 
-            assert delay > 0.0
-
-            self._policy = FixedBackoffPolicy(delay=delay)
-        elif policy_type == "random":
-            minimum_delay = policy.get("minimum_delay")
-            maximum_delay = policy.get("maximum_delay")
+        if not isinstance(policy_type, str):
+            raise RequestsStampede.exceptions.InvalidCustomBackoffPolicy(policy_type)
 
-            assert isinstance(minimum_delay, float)
-            assert isinstance(maximum_delay, float)
+        # Policy types are matched case-insensitively
+        if not policy_type.islower():
+            policy_type = policy_type.lower()
+
+        try:
+            policy_class, parameters, optional_parameters = _CUSTOM_BACKOFF_POLICIES[
+                policy_type
+            ]
+        except KeyError:
+            raise RequestsStampede.exceptions.InvalidCustomBackoffPolicy(
+                policy_type
+            ) from None
+
+        kwargs = {
+            parameter: policy[parameter]
+            for parameter in optional_parameters
+            if parameter in policy
+        }
 
-            assert minimum_delay > 0.0
-            assert maximum_delay > 0.0
-            assert maximum_delay > minimum_delay
+        # File-based delays must be positive, rather than merely non-negative
+        for parameter in parameters:
+            value = _float_parameter(parameter, policy.get(parameter))
 
-            self._policy = RandomBackoffPolicy(
-                minimum_delay=minimum_delay, maximum_delay=maximum_delay
-            )
-        elif policy_type == "fibonacci":
-            initial_delay = policy.get("initial_delay")
-            maximum_delay = policy.get("maximum_delay")
+            if value <= 0.0:
+                raise ValueError(f"{parameter} must be positive")
 
-            assert isinstance(initial_delay, float)
-            assert isinstance(maximum_delay, float)
+            kwargs[parameter] = value
 
-            assert initial_delay > 0.0
-            assert maximum_delay > 0.0
-            assert maximum_delay > initial_delay
+        self._policy = policy_class(**kwargs)
 
-            self._policy = FibonacciBackoffPolicy(
-                initial_delay=initial_delay, maximum_delay=maximum_delay
-            )
-        else:
-            raise RequestsStampede.exceptions.InvalidCustomBackoffPolicy(policy_type)
+        cls = type(self)
+        self._repr = (
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"policy={self._policy!r}>"
+        )
 
     def delay(self) -> typing.Iterable[float]:
         """
@@ -265,3 +673,20 @@ class CustomBackoffPolicy(AbstractBackoffPolicy):
         :rtype: typing.Iterable[float]
         """
         return self._policy.delay()
+
+    def as_array(self, n: int) -> array.array:
+        """
+        Returns the first n backoff delays, computed up front, as a compact
+        array of floats.
+
+        :param n: The number of backoff delays to compute.
+
+        :type n: int
+
+        :return: An array of n floats.
+        :rtype: array.array
+        """
+        return self._policy.as_array(n)
+
+    def __repr__(self):
+        return self._repr
@@ -4,8 +4,8 @@ Build-in retry policies and their abstract class.
 
 
 import abc
+import sys
 import typing
-import math
 
 import RequestsStampede.exceptions
 
@@ -15,14 +15,45 @@ class AbstractRetryPolicy(abc.ABC):
     An abstract class for use in implementing retry policies.
     """
 
+    __slots__ = ()
+
+    _repr: str
+
     attempts: int
 
+    # Infinite retry policies have no meaningful number of attempts; their
+    # attempts attribute is set to sys.maxsize. Policies whose attempts
+    # attribute is math.inf are also treated as infinite.
+    is_infinite: bool = False
+
+
+def _attempts_parameter(attempts: typing.Any) -> int:
+    """
+    Validates that a retry attempts parameter is a positive integer.
+
+    :param attempts: The parameter's value.
+
+    :type attempts: typing.Any
+
+    :return: The parameter's value.
+    :rtype: int
+    """
+    if isinstance(attempts, bool) or not isinstance(attempts, int):
+        raise TypeError(f"attempts must be an int, not {type(attempts).__name__}")
+
+    if attempts <= 0:
+        raise ValueError("attempts must be positive")
+
+    return attempts
+
 
 class FixedRetryPolicy(AbstractRetryPolicy):
     """
     Establishes a constant retry policy.
     """
 
+    __slots__ = ("attempts", "_repr")
+
     def __init__(self, attempts: typing.Optional[int] = 5):
         """
         A basic constructor.
@@ -31,18 +62,16 @@ class FixedRetryPolicy(AbstractRetryPolicy):
 
         :type attempts: int
         """
-        assert isinstance(attempts, int)
-        assert attempts > 0
+        self.attempts = _attempts_parameter(attempts)
 
-        self.attempts = attempts
+        cls = type(self)
+        self._repr = (
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"attempts={self.attempts}>"
+        )
 
     def __repr__(self):
-        return "<{}.{} object at {} attempts={}>".format(
-            __class__.__module__,
-            __class__.__name__,
-            hex(id(self)),
-            self.attempts,
-        )
+        return self._repr
 
 
 class InfiniteRetryPolicy(AbstractRetryPolicy):
@@ -50,20 +79,25 @@ class InfiniteRetryPolicy(AbstractRetryPolicy):
     Establishes an infinite retry policy.
     """
 
+    __slots__ = ("attempts", "_repr")
+
+    is_infinite = True
+
     def __init__(self):
         """
         A basic constructor that takes no parameters.
         """
-        self.attempts = math.inf
+        self.attempts = sys.maxsize
 
-    def __repr__(self):
-        return "<{}.{} object at {} attempts={}>".format(
-            __class__.__module__,
-            __class__.__name__,
-            hex(id(self)),
-            self.attempts,
+        cls = type(self)
+        self._repr = (
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"attempts={self.attempts}>"
         )
 
+    def __repr__(self):
+        return self._repr
+
 
 class ConditionalRetryPolicy(AbstractRetryPolicy):
     """
@@ -72,15 +106,27 @@ class ConditionalRetryPolicy(AbstractRetryPolicy):
     Not Implemented.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         raise NotImplementedError
 
 
+# Custom retry policy types, mapped to the built-in policy class they
+# construct and the parameters that policy class is given
+_CUSTOM_RETRY_POLICIES = {
+    "fixed": (FixedRetryPolicy, ("attempts",)),
+    "infinite": (InfiniteRetryPolicy, ()),
+}
+
+
 class CustomRetryPolicy(AbstractRetryPolicy):
     """
     Establishes a custom file-based retry policy.
     """
 
+    __slots__ = ("attempts", "is_infinite", "_repr")
+
     def __init__(self, policy: dict):
         """
         Provided a policy definition, initializes a custom retry policy based
@@ -102,24 +148,34 @@ class CustomRetryPolicy(AbstractRetryPolicy):
         :type policy: dict
         """
 
-        policy_type = policy.get("type").lower()
+        policy_type = policy.get("type")
 
-        if policy_type == "fixed":
-            attempts = policy.get("attempts")
+        if not isinstance(policy_type, str):
+            raise RequestsStampede.exceptions.InvalidCustomRetryPolicy(policy_type)
 
-            assert isinstance(attempts, int)
-            assert attempts > 0
+        # Policy types are matched case-insensitively
+        if not policy_type.islower():
+            policy_type = policy_type.lower()
 
-            self.attempts = attempts
-        elif policy_type == "infinite":
-            self.attempts = math.inf
-        else:
-            raise RequestsStampede.exceptions.InvalidCustomRetryPolicy(policy_type)
+        try:
+            policy_class, parameters = _CUSTOM_RETRY_POLICIES[policy_type]
+        except KeyError:
+            raise RequestsStampede.exceptions.InvalidCustomRetryPolicy(
+                policy_type
+            ) from None
 
-    def __repr__(self):
-        return "<{}.{} object at {} attempts={}>".format(
-            __class__.__module__,
-            __class__.__name__,
-            hex(id(self)),
-            self.attempts,
+        retry_policy = policy_class(
+            **{parameter: policy.get(parameter) for parameter in parameters}
+        )
+
+        self.attempts = retry_policy.attempts
+        self.is_infinite = retry_policy.is_infinite
+
+        cls = type(self)
+        self._repr = (
+            f"<{cls.__module__}.{cls.__name__} object at {id(self):#x} "
+            f"attempts={self.attempts}>"
         )
+
+    def __repr__(self):
+        return self._repr
@@ -33,7 +33,6 @@ setuptools.setup(
         "Intended Audience :: Developers",
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -44,5 +43,6 @@ setuptools.setup(
     ],
     packages=setuptools.find_packages(),
     install_requires=["schema>=0.7.4", "pyyaml>=5.4.1", "requests>=2.25.1"],
+    extras_require={"async": ["httpx>=0.18.0"]},
     python_requires=">=3.7",
 )
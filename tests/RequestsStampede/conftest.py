@@ -0,0 +1,80 @@
+# pylint: disable=redefined-outer-name
+
+"""
+Fixtures shared by the RequestsStampede test modules.
+
+The RetryRequest and RetrySession fixtures are session scoped, and are
+therefore shared by every test that requests them; tests must only inspect
+them. Tests that need to modify a request interface should construct their
+own.
+"""
+
+
+import pytest
+import requests
+import requests.adapters
+
+import RequestsStampede.horde
+import RequestsStampede.config
+import RequestsStampede.policy.retry
+import RequestsStampede.policy.backoff
+
+
+def _custom_session(cls):
+    """
+    Returns the custom session passed to the given request interface class,
+    whose connection pool is sized for concurrent requests; RetrySession
+    instances are given a session with additional headers.
+    """
+    custom_session = requests.Session()
+
+    adapter = requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20)
+    custom_session.mount("https://", adapter)
+    custom_session.mount("http://", adapter)
+
+    if issubclass(cls, RequestsStampede.horde.RetrySession):
+        custom_session.headers.update(
+            {"User-Agent": "RonSwanson/1.0", "Authorization": "Bearer ICanDoWhatIWant"}
+        )
+
+    return custom_session
+
+
+@pytest.fixture(scope="session")
+def aggressive_config():
+    """
+    The custom retry configuration shared by the custom request interfaces.
+    Request interfaces do not modify their retry configuration.
+    """
+    return RequestsStampede.config.AggressiveRetryConfig(
+        retry_policy=RequestsStampede.policy.retry.InfiniteRetryPolicy(),
+        backoff_policy=RequestsStampede.policy.backoff.RandomBackoffPolicy(),
+    )
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        (RequestsStampede.horde.RetryRequest, "default"),
+        (RequestsStampede.horde.RetryRequest, "custom"),
+        (RequestsStampede.horde.RetrySession, "default"),
+        (RequestsStampede.horde.RetrySession, "custom"),
+    ],
+    ids=lambda param: f"{param[0].__name__}-{param[1]}",
+)
+def horde_instance(request, aggressive_config):
+    """
+    Yields a (class, mode, instance) tuple for each request interface class,
+    constructed either with its default parameters or with a custom retry
+    configuration and session.
+    """
+    cls, mode = request.param
+
+    if mode == "default":
+        return cls, mode, cls()
+
+    return (
+        cls,
+        mode,
+        cls(retry_config=aggressive_config, session=_custom_session(cls)),
+    )
@@ -4,12 +4,16 @@ TODO
 """
 
 
+import array
+import itertools
 import math
+import random
 import statistics
 
 import pytest
 import scipy.stats
 
+import RequestsStampede.exceptions
 import RequestsStampede.policy.backoff
 
 
@@ -133,6 +137,24 @@ def test_random_backoff_policy_delay_sequence(random_backoff_policy):
     assert confidence >= acceptable_confidence
 
 
+def test_random_backoff_policy_zero_minimum_delay():
+    """
+    Ensures that a random backoff policy without a lower bound yields delays
+    within its upper bound.
+    """
+    random_backoff_policy = RequestsStampede.policy.backoff.RandomBackoffPolicy(
+        minimum_delay=0.0, maximum_delay=2.0
+    )
+
+    backoff_generator = random_backoff_policy.delay()
+
+    for _ in range(1000):
+        delay = next(backoff_generator)
+
+        assert isinstance(delay, float)
+        assert 0.0 <= delay <= 2.0
+
+
 def test_fibonacci_backoff_policy_default_parameters(fibonacci_backoff_policy):
     """
     Ensures that the fibonacci backoff policy has reasonable defaults and yield
@@ -179,3 +201,372 @@ def test_fibonacci_backoff_policy_delay_sequence(fibonacci_backoff_policy):
 
         assert isinstance(delay, float)
         assert delay == fibonacci
+
+
+def test_fibonacci_backoff_policy_delay_generators_independent(
+    fibonacci_backoff_policy,
+):
+    """
+    Ensures that each delay generator restarts the fibonacci sequence.
+    """
+    first = fibonacci_backoff_policy.delay()
+
+    assert [next(first) for _ in range(5)] == [0.0, 1.0, 1.0, 2.0, 3.0]
+    assert next(fibonacci_backoff_policy.delay()) == 0.0
+    assert next(first) == 5.0
+
+
+def test_fibonacci_backoff_policy_shared_prefix():
+    """
+    Ensures that fibonacci backoff policies with the same parameters share a
+    single precomputed sequence.
+    """
+    first = RequestsStampede.policy.backoff.FibonacciBackoffPolicy(3.0, 90.0)
+    second = RequestsStampede.policy.backoff.FibonacciBackoffPolicy(3.0, 90.0)
+
+    assert first._prefix is second._prefix  # pylint: disable=protected-access
+    assert list(first.as_array(8)) == [3.0, 4.0, 7.0, 11.0, 18.0, 29.0, 47.0, 76.0]
+
+
+def test_fibonacci_backoff_policy_negative_initial_delay():
+    """
+    Ensures that a negative initial delay, whose sequence would never reach
+    the maximum delay, is rejected.
+    """
+    with pytest.raises(ValueError):
+        RequestsStampede.policy.backoff.FibonacciBackoffPolicy(initial_delay=-1.0)
+
+
+@pytest.mark.parametrize("n", [0, 1, 5, 13, 50])
+def test_fibonacci_backoff_policy_as_array(fibonacci_backoff_policy, n):
+    """
+    Ensures that the precomputed fibonacci backoff delays match those yielded
+    by the delay generator.
+    """
+    delays = fibonacci_backoff_policy.as_array(n)
+
+    assert isinstance(delays, array.array)
+    assert list(delays) == list(itertools.islice(fibonacci_backoff_policy.delay(), n))
+
+
+def test_fixed_backoff_policy_as_array(fixed_backoff_policy):
+    """
+    Ensures that the default precomputed backoff delays are drawn from the
+    delay generator.
+    """
+    delays = fixed_backoff_policy.as_array(3)
+
+    assert isinstance(delays, array.array)
+    assert list(delays) == [5.0, 5.0, 5.0]
+    assert len(fixed_backoff_policy.as_array(0)) == 0
+
+
+def test_random_backoff_policy_as_array(random_backoff_policy):
+    """
+    Ensures that the precomputed random backoff delays fall within the
+    policy's bounds.
+    """
+    delays = random_backoff_policy.as_array(1000)
+
+    assert isinstance(delays, array.array)
+    assert len(delays) == 1000
+    assert all(3.0 <= delay <= 15.0 for delay in delays)
+
+
+def test_random_backoff_policy_seeded_distribution(random_backoff_policy):
+    """
+    Ensures that random backoff delays drawn from a seeded random number
+    generator are reproducible, fall within the policy's bounds and are spread
+    across them.
+    """
+    samples = list(
+        itertools.islice(random_backoff_policy.delay(rng=random.Random(42)), 1000)
+    )
+
+    assert samples == list(random_backoff_policy.as_array(1000, rng=random.Random(42)))
+    assert 3.0 <= min(samples) and max(samples) <= 15.0
+    assert 5.0 < statistics.mean(samples) < 13.0
+
+
+@pytest.mark.parametrize(
+    "policy_class, kwargs, exception",
+    [
+        (RequestsStampede.policy.backoff.FixedBackoffPolicy, {"delay": "5"}, TypeError),
+        (
+            RequestsStampede.policy.backoff.FixedBackoffPolicy,
+            {"delay": -1.0},
+            ValueError,
+        ),
+        (
+            RequestsStampede.policy.backoff.RandomBackoffPolicy,
+            {"minimum_delay": None},
+            TypeError,
+        ),
+        (
+            RequestsStampede.policy.backoff.RandomBackoffPolicy,
+            {"minimum_delay": 5.0, "maximum_delay": 5.0},
+            ValueError,
+        ),
+        (
+            RequestsStampede.policy.backoff.FibonacciBackoffPolicy,
+            {"maximum_delay": True},
+            TypeError,
+        ),
+        (
+            RequestsStampede.policy.backoff.FibonacciBackoffPolicy,
+            {"initial_delay": 3.0, "maximum_delay": 2.0},
+            ValueError,
+        ),
+        (
+            RequestsStampede.policy.backoff.FibonacciBackoffPolicy,
+            {"maximum_delay": math.inf},
+            ValueError,
+        ),
+        (
+            RequestsStampede.policy.backoff.FibonacciBackoffPolicy,
+            {"initial_delay": math.nan},
+            ValueError,
+        ),
+    ],
+)
+def test_backoff_policy_invalid_parameters(policy_class, kwargs, exception):
+    """
+    Ensures that invalid backoff delays are rejected, including when Python's
+    assertions are disabled.
+    """
+    with pytest.raises(exception):
+        policy_class(**kwargs)
+
+
+def test_backoff_policy_integer_parameters():
+    """
+    Ensures that integer backoff delays are accepted and stored as floats.
+    """
+    fixed_backoff_policy = RequestsStampede.policy.backoff.FixedBackoffPolicy(3)
+    fibonacci_backoff_policy = RequestsStampede.policy.backoff.FibonacciBackoffPolicy(
+        initial_delay=1, maximum_delay=10
+    )
+
+    assert isinstance(fixed_backoff_policy.constant_delay, float)
+    assert isinstance(fibonacci_backoff_policy.initial_delay, float)
+    assert isinstance(fibonacci_backoff_policy.maximum_delay, float)
+    assert list(fibonacci_backoff_policy.as_array(6)) == [1.0, 2.0, 3.0, 5.0, 8.0, 10.0]
+
+
+@pytest.mark.parametrize(
+    "policy, policy_class",
+    [
+        ({"type": "fixed", "delay": 2.0}, "FixedBackoffPolicy"),
+        (
+            {"type": "Random", "minimum_delay": 1.0, "maximum_delay": 2.0},
+            "RandomBackoffPolicy",
+        ),
+        (
+            {"type": "fibonacci", "initial_delay": 1.0, "maximum_delay": 2.0},
+            "FibonacciBackoffPolicy",
+        ),
+    ],
+)
+def test_custom_backoff_policy_types(policy, policy_class):
+    """
+    Ensures that each custom backoff policy type constructs the matching
+    built-in backoff policy.
+    """
+    custom_backoff_policy = RequestsStampede.policy.backoff.CustomBackoffPolicy(policy)
+
+    # pylint: disable=protected-access
+    assert type(custom_backoff_policy._policy).__name__ == policy_class
+
+
+def test_custom_backoff_policy_invalid_type():
+    """
+    Ensures that an unknown custom backoff policy type is rejected.
+    """
+    with pytest.raises(RequestsStampede.exceptions.InvalidCustomBackoffPolicy):
+        RequestsStampede.policy.backoff.CustomBackoffPolicy({"type": "linear"})
+
+
+def test_backoff_policies_are_slotted(
+    fixed_backoff_policy, random_backoff_policy, fibonacci_backoff_policy
+):
+    """
+    Ensures that the backoff policies do not allocate an instance __dict__.
+    """
+    custom_backoff_policy = RequestsStampede.policy.backoff.CustomBackoffPolicy(
+        {"type": "fixed", "delay": 2.0}
+    )
+
+    for policy in (
+        fixed_backoff_policy,
+        random_backoff_policy,
+        fibonacci_backoff_policy,
+        custom_backoff_policy,
+    ):
+        assert not hasattr(policy, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "policy, parameters",
+    [
+        (
+            RequestsStampede.policy.backoff.FibonacciBackoffPolicy(),
+            ("initial_delay", "maximum_delay"),
+        ),
+        (
+            RequestsStampede.policy.backoff.ExponentialBackoffPolicy(),
+            ("initial_delay", "maximum_delay", "factor", "jitter"),
+        ),
+    ],
+)
+def test_backoff_policy_parameters_are_read_only(policy, parameters):
+    """
+    Ensures that the parameters of backoff policies that precompute their
+    sequence and representation cannot be reassigned.
+    """
+    for parameter in parameters:
+        with pytest.raises(AttributeError):
+            setattr(policy, parameter, 1000.0)
+
+
+def test_custom_backoff_policy_repr():
+    """
+    Ensures that a custom backoff policy's representation names the policy it
+    wraps, and is built once.
+    """
+    custom_backoff_policy = RequestsStampede.policy.backoff.CustomBackoffPolicy(
+        {"type": "fixed", "delay": 2.0}
+    )
+
+    assert repr(custom_backoff_policy).startswith(
+        "<RequestsStampede.policy.backoff.CustomBackoffPolicy object at "
+    )
+    assert "policy=<RequestsStampede.policy.backoff.FixedBackoffPolicy" in repr(
+        custom_backoff_policy
+    )
+    assert repr(custom_backoff_policy) is repr(custom_backoff_policy)
+
+
+def test_exponential_backoff_policy_delay_sequence():
+    """
+    Ensures that the exponential backoff policy, without jitter, doubles its
+    delay up to the maximum delay.
+    """
+    exponential_backoff_policy = (
+        RequestsStampede.policy.backoff.ExponentialBackoffPolicy(
+            initial_delay=1.0, maximum_delay=60.0, jitter=0.0
+        )
+    )
+
+    assert list(exponential_backoff_policy.as_array(9)) == [
+        1.0,
+        2.0,
+        4.0,
+        8.0,
+        16.0,
+        32.0,
+        60.0,
+        60.0,
+        60.0,
+    ]
+
+
+def test_exponential_backoff_policy_jitter():
+    """
+    Ensures that each exponential backoff delay is jittered within the
+    configured fraction of its un-jittered value.
+    """
+    exponential_backoff_policy = (
+        RequestsStampede.policy.backoff.ExponentialBackoffPolicy()
+    )
+
+    assert exponential_backoff_policy.jitter == 0.5
+
+    expected = itertools.chain(
+        [1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0], itertools.repeat(120.0)
+    )
+
+    for delay, unjittered in zip(exponential_backoff_policy.as_array(1000), expected):
+        assert 0.5 * unjittered <= delay <= 1.5 * unjittered
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"initial_delay": 0.0},
+        {"factor": 1.0},
+        {"jitter": 1.0},
+        {"jitter": -0.1},
+        {"maximum_delay": math.inf},
+        {"factor": math.inf},
+        {"initial_delay": math.nan},
+    ],
+)
+def test_exponential_backoff_policy_invalid_parameters(kwargs):
+    """
+    Ensures that exponential backoff policies that would never grow, never
+    reach their maximum delay, or whose jitter could produce negative delays,
+    are rejected.
+    """
+    with pytest.raises(ValueError):
+        RequestsStampede.policy.backoff.ExponentialBackoffPolicy(**kwargs)
+
+
+def test_custom_backoff_policy_exponential():
+    """
+    Ensures that the optional exponential backoff policy parameters may be
+    omitted from, or provided by, a custom backoff policy.
+    """
+    default = RequestsStampede.policy.backoff.CustomBackoffPolicy(
+        {"type": "exponential", "initial_delay": 1.0, "maximum_delay": 8.0}
+    )
+    custom = RequestsStampede.policy.backoff.CustomBackoffPolicy(
+        {
+            "type": "exponential",
+            "initial_delay": 1.0,
+            "maximum_delay": 30.0,
+            "factor": 3.0,
+            "jitter": 0.0,
+        }
+    )
+
+    assert len(default.as_array(5)) == 5
+    assert list(custom.as_array(5)) == [1.0, 3.0, 9.0, 27.0, 30.0]
+
+
+@pytest.mark.parametrize("policy", [{}, {"type": None}, {"type": 1}])
+def test_custom_backoff_policy_missing_type(policy):
+    """
+    Ensures that a custom backoff policy without a textual type is rejected as
+    an invalid policy.
+    """
+    with pytest.raises(RequestsStampede.exceptions.InvalidCustomBackoffPolicy):
+        RequestsStampede.policy.backoff.CustomBackoffPolicy(policy)
+
+
+def test_fibonacci_backoff_policy_as_array_is_a_copy(fibonacci_backoff_policy):
+    """
+    Ensures that modifying the precomputed backoff delays of one request does
+    not affect the shared sequence of the policy.
+    """
+    delays = fibonacci_backoff_policy.as_array(3)
+    delays[0] = 99.0
+
+    assert list(fibonacci_backoff_policy.as_array(3)) == [0.0, 1.0, 1.0]
+    assert next(fibonacci_backoff_policy.delay()) == 0.0
+
+
+def test_backoff_policy_repr_names_subclass():
+    """
+    Ensures that a backoff policy subclass' representation names the subclass.
+    """
+
+    class SubclassBackoffPolicy(RequestsStampede.policy.backoff.FixedBackoffPolicy):
+        """
+        A trivial FixedBackoffPolicy subclass.
+        """
+
+        __slots__ = ()
+
+    assert repr(SubclassBackoffPolicy()).startswith(
+        f"<{__name__}.SubclassBackoffPolicy object at 0x"
+    )
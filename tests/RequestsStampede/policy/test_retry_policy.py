@@ -5,10 +5,11 @@ TODO
 """
 
 
-import math
+import sys
 
 import pytest
 
+import RequestsStampede.exceptions
 import RequestsStampede.policy.retry
 
 
@@ -55,8 +56,9 @@ def test_infinite_retry_policy_default_parameters(infinite_retry_policy):
         infinite_retry_policy, RequestsStampede.policy.retry.AbstractRetryPolicy
     )
 
-    assert isinstance(infinite_retry_policy.attempts, float)
-    assert infinite_retry_policy.attempts == math.inf
+    assert isinstance(infinite_retry_policy.attempts, int)
+    assert infinite_retry_policy.attempts == sys.maxsize
+    assert infinite_retry_policy.is_infinite is True
 
 
 def test_conditional_retry_policy_default_parameters():
@@ -69,3 +71,86 @@ def test_conditional_retry_policy_default_parameters():
         assert isinstance(e, NotImplementedError)
     else:
         assert False
+
+
+@pytest.mark.parametrize(
+    "attempts, exception",
+    [("5", TypeError), (5.0, TypeError), (True, TypeError), (0, ValueError)],
+)
+def test_fixed_retry_policy_invalid_parameters(attempts, exception):
+    """
+    Ensures that invalid retry attempts are rejected, including when Python's
+    assertions are disabled.
+    """
+    with pytest.raises(exception):
+        RequestsStampede.policy.retry.FixedRetryPolicy(attempts=attempts)
+
+    with pytest.raises(exception):
+        RequestsStampede.policy.retry.CustomRetryPolicy(
+            {"type": "fixed", "attempts": attempts}
+        )
+
+
+def test_custom_retry_policy_types():
+    """
+    Ensures that each custom retry policy type is given the attempts of the
+    matching built-in retry policy.
+    """
+    fixed = RequestsStampede.policy.retry.CustomRetryPolicy(
+        {"type": "Fixed", "attempts": 3}
+    )
+    infinite = RequestsStampede.policy.retry.CustomRetryPolicy({"type": "infinite"})
+
+    assert fixed.attempts == 3
+    assert infinite.attempts == sys.maxsize
+    assert infinite.is_infinite is True
+
+
+def test_custom_retry_policy_invalid_type():
+    """
+    Ensures that an unknown custom retry policy type is rejected.
+    """
+    with pytest.raises(RequestsStampede.exceptions.InvalidCustomRetryPolicy):
+        RequestsStampede.policy.retry.CustomRetryPolicy({"type": "conditional"})
+
+
+def test_retry_policies_are_slotted(fixed_retry_policy, infinite_retry_policy):
+    """
+    Ensures that the retry policies do not allocate an instance __dict__.
+    """
+    custom_retry_policy = RequestsStampede.policy.retry.CustomRetryPolicy(
+        {"type": "fixed", "attempts": 3}
+    )
+
+    for policy in (fixed_retry_policy, infinite_retry_policy, custom_retry_policy):
+        assert not hasattr(policy, "__dict__")
+
+    assert fixed_retry_policy.is_infinite is False
+    assert custom_retry_policy.is_infinite is False
+
+
+@pytest.mark.parametrize("policy", [{}, {"type": None}, {"type": 1}])
+def test_custom_retry_policy_missing_type(policy):
+    """
+    Ensures that a custom retry policy without a textual type is rejected as
+    an invalid policy.
+    """
+    with pytest.raises(RequestsStampede.exceptions.InvalidCustomRetryPolicy):
+        RequestsStampede.policy.retry.CustomRetryPolicy(policy)
+
+
+def test_retry_policy_repr_names_subclass():
+    """
+    Ensures that a retry policy subclass' representation names the subclass.
+    """
+
+    class SubclassRetryPolicy(RequestsStampede.policy.retry.FixedRetryPolicy):
+        """
+        A trivial FixedRetryPolicy subclass.
+        """
+
+        __slots__ = ()
+
+    assert repr(SubclassRetryPolicy()).startswith(
+        f"<{__name__}.SubclassRetryPolicy object at 0x"
+    )
@@ -5,7 +5,9 @@ Tests the retry configuration objects present in RequestsStampede.config
 """
 
 
-import math
+import pathlib
+import subprocess
+import sys
 
 import pytest
 
@@ -14,6 +16,16 @@ import RequestsStampede.policy.retry
 import RequestsStampede.policy.backoff
 
 
+@pytest.fixture(autouse=True)
+def config_environment(monkeypatch):
+    """
+    Clears the environment variables that bypass the configuration file search,
+    such that the tests are independent of the environment they are run in.
+    """
+    monkeypatch.delenv("REQUESTSSTAMPEDE_NO_CONFIG", raising=False)
+    monkeypatch.delenv("REQUESTSSTAMPEDE_CONFIG", raising=False)
+
+
 @pytest.fixture
 def default_retry_config():
     """
@@ -149,8 +161,9 @@ def test_aggressive_retry_config_parameters(aggressive_retry_config):
         aggressive_retry_config.retry_policy,
         RequestsStampede.policy.retry.InfiniteRetryPolicy,
     )
-    assert isinstance(aggressive_retry_config.retry_policy.attempts, float)
-    assert aggressive_retry_config.retry_policy.attempts == math.inf
+    assert isinstance(aggressive_retry_config.retry_policy.attempts, int)
+    assert aggressive_retry_config.retry_policy.attempts == sys.maxsize
+    assert aggressive_retry_config.retry_policy.is_infinite is True
 
     # Validate backoff_policy and default values
     assert isinstance(
@@ -163,3 +176,246 @@ def test_aggressive_retry_config_parameters(aggressive_retry_config):
     )
     assert isinstance(aggressive_retry_config.backoff_policy.constant_delay, float)
     assert aggressive_retry_config.backoff_policy.constant_delay == 5.0
+
+
+def test_load_is_cached():
+    """
+    Ensures that the environment specific retry configuration is only resolved
+    once per process, rather than once per RetryRequest or RetrySession.
+    """
+    RequestsStampede.config.load.cache_clear()
+
+    first = RequestsStampede.config.load()
+    second = RequestsStampede.config.load()
+
+    assert isinstance(first, RequestsStampede.config.AbstractRetryConfig)
+    assert first is second
+
+
+def test_resolve_path_parent_directory(tmp_path, monkeypatch):
+    """
+    Ensures that a configuration file located in a parent directory of the
+    current working directory is discovered, and that directories sharing the
+    configuration filename are ignored.
+    """
+    config_path = tmp_path / "stampede.yml"
+    config_path.write_text("retry_config: {}\n")
+
+    working_dir = tmp_path / "application" / "stampede.yml"
+    working_dir.mkdir(parents=True)
+
+    monkeypatch.chdir(working_dir.parent)
+
+    assert RequestsStampede.config.resolve_path() == config_path
+
+
+def test_resolve_path_home_directory(tmp_path, monkeypatch):
+    """
+    Ensures that the home directory is inspected once the root directory has
+    been reached without locating a configuration file.
+    """
+    home_dir = tmp_path / "home"
+    home_dir.mkdir()
+
+    config_path = home_dir / "stampede.yml"
+    config_path.write_text("retry_config: {}\n")
+
+    working_dir = tmp_path / "application"
+    working_dir.mkdir()
+
+    monkeypatch.chdir(working_dir)
+    monkeypatch.setenv("HOME", str(home_dir))
+
+    resolved_path = RequestsStampede.config.resolve_path()
+
+    assert isinstance(resolved_path, pathlib.Path)
+    assert resolved_path == config_path
+
+
+def test_resolve_path_no_config(tmp_path, monkeypatch):
+    """
+    Ensures that the configuration file search is skipped when the environment
+    declares that there is no configuration file.
+    """
+    (tmp_path / "stampede.yml").write_text("retry_config: {}\n")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("REQUESTSSTAMPEDE_NO_CONFIG", "1")
+
+    assert RequestsStampede.config.resolve_path() is None
+
+
+def test_resolve_path_explicit_config(tmp_path, monkeypatch):
+    """
+    Ensures that an explicitly configured path is selected without searching
+    the file-system, and that a missing explicit path is not searched for.
+    """
+    (tmp_path / "stampede.yml").write_text("retry_config: {}\n")
+
+    config_path = tmp_path / "explicit" / "retry.yml"
+    config_path.parent.mkdir()
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("REQUESTSSTAMPEDE_CONFIG", str(config_path))
+
+    assert RequestsStampede.config.resolve_path() is None
+
+    config_path.write_text("retry_config: {}\n")
+
+    assert RequestsStampede.config.resolve_path() == config_path
+
+
+def test_parse_custom_retry_config(tmp_path):
+    """
+    Ensures that a retry configuration file is parsed into an equivalent
+    CustomRetryConfig object.
+    """
+    config_path = tmp_path / "stampede.yml"
+    config_path.write_text(
+        "retry_config:\n"
+        "  retry_enabled: True\n"
+        "  retry_policy:\n"
+        "    type: fixed\n"
+        "    attempts: 3\n"
+        "  backoff_enabled: True\n"
+        "  backoff_policy:\n"
+        "    type: fixed\n"
+        "    delay: 2.5\n"
+    )
+
+    custom_retry_config = RequestsStampede.config.parse(config_path)
+
+    assert isinstance(custom_retry_config, RequestsStampede.config.CustomRetryConfig)
+    assert custom_retry_config.retry_enabled
+    assert custom_retry_config.backoff_enabled
+    assert custom_retry_config.retry_policy.attempts == 3
+    assert next(custom_retry_config.backoff_policy.delay()) == 2.5
+
+
+def test_parse_is_cached_until_modified(tmp_path):
+    """
+    Ensures that repeatedly parsing an unmodified retry configuration file
+    returns the cached object, and that modifications are picked up.
+    """
+    config_path = tmp_path / "stampede.yml"
+    config_path.write_text(
+        "retry_config:\n"
+        "  retry_policy:\n"
+        "    type: fixed\n"
+        "    attempts: 3\n"
+        "  backoff_policy:\n"
+        "    type: fixed\n"
+        "    delay: 2.5\n"
+    )
+
+    first = RequestsStampede.config.parse(config_path)
+    second = RequestsStampede.config.parse(config_path)
+
+    assert first is second
+
+    config_path.write_text(
+        "retry_config:\n"
+        "  retry_policy:\n"
+        "    type: fixed\n"
+        "    attempts: 10\n"
+        "  backoff_policy:\n"
+        "    type: fixed\n"
+        "    delay: 2.5\n"
+    )
+
+    third = RequestsStampede.config.parse(config_path)
+
+    assert third is not first
+    assert third.retry_policy.attempts == 10
+
+
+def test_parse_applies_schema_defaults(tmp_path):
+    """
+    Ensures that optional retry configuration values omitted from a
+    configuration file take on their schema defaults.
+    """
+    config_path = tmp_path / "stampede.yml"
+    config_path.write_text(
+        "retry_config:\n"
+        "  retry_policy:\n"
+        "    type: infinite\n"
+        "  backoff_policy:\n"
+        "    type: fixed\n"
+        "    delay: 2.5\n"
+    )
+
+    custom_retry_config = RequestsStampede.config.parse(config_path)
+
+    assert custom_retry_config.retry_enabled is True
+    assert custom_retry_config.backoff_enabled is True
+    assert custom_retry_config.retry_policy.attempts == sys.maxsize
+    assert custom_retry_config.retry_policy.is_infinite is True
+
+
+def test_parse_omitted_policies(tmp_path):
+    """
+    Ensures that policies omitted from a configuration file are inherited from
+    the default retry configuration.
+    """
+    config_path = tmp_path / "stampede.yml"
+    config_path.write_text("retry_config:\n  retry_enabled: True\n")
+
+    custom_retry_config = RequestsStampede.config.parse(config_path)
+    default_retry_config = RequestsStampede.config.DefaultRetryConfig()
+
+    assert isinstance(custom_retry_config, RequestsStampede.config.CustomRetryConfig)
+    assert custom_retry_config.retry_enabled is True
+    assert custom_retry_config.retry_policy is default_retry_config.retry_policy
+    assert custom_retry_config.backoff_policy is default_retry_config.backoff_policy
+
+
+def test_parse_exponential_backoff_policy(tmp_path):
+    """
+    Ensures that an exponential backoff policy may be configured by file.
+    """
+    config_path = tmp_path / "stampede.yml"
+    config_path.write_text(
+        "retry_config:\n"
+        "  retry_policy:\n"
+        "    type: fixed\n"
+        "    attempts: 4\n"
+        "  backoff_policy:\n"
+        "    type: exponential\n"
+        "    initial_delay: 0.5\n"
+        "    maximum_delay: 10.0\n"
+        "    jitter: 0.0\n"
+    )
+
+    custom_retry_config = RequestsStampede.config.parse(config_path)
+
+    assert list(custom_retry_config.backoff_policy.as_array(3)) == [0.5, 1.0, 2.0]
+
+
+def test_retry_config_repr_names_subclass(default_retry_config):
+    """
+    Ensures that a retry configuration's representation reports its own class,
+    rather than the abstract class defining __repr__.
+    """
+    assert repr(default_retry_config).startswith(
+        "<RequestsStampede.config.DefaultRetryConfig object at 0x"
+    )
+
+
+def test_config_file_dependencies_imported_lazily():
+    """
+    Ensures that importing the package does not import the libraries that are
+    only needed to parse a retry configuration file.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, RequestsStampede.horde; "
+            "print('yaml' in sys.modules, 'schema' in sys.modules)",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.split() == ["False", "False"]
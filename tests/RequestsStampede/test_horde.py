@@ -5,254 +5,557 @@ Tests the RequestsStampede horde module.
 """
 
 
+import asyncio
+import json
 import logging
-import math
+import subprocess
+import sys
 
 import pytest
 import requests
+import requests.adapters
 import requests.structures
+import responses
 
 import RequestsStampede.horde
 import RequestsStampede.config
+import RequestsStampede.policy.retry
+import RequestsStampede.policy.backoff
+
+
+# The normalized forms of the retry configurations constructed by the
+# horde_instance fixture, see _normalize_config()
+EXPECTED_DEFAULT_CONFIG = {
+    "retry_enabled": (bool, True),
+    "backoff_enabled": (bool, True),
+    "retry_policy": {
+        "type": RequestsStampede.policy.retry.FixedRetryPolicy,
+        "attempts": (int, 5),
+    },
+    "backoff_policy": {
+        "type": RequestsStampede.policy.backoff.FibonacciBackoffPolicy,
+        "initial_delay": (float, 0.0),
+        "maximum_delay": (float, 144.0),
+    },
+}
+
+EXPECTED_CUSTOM_CONFIG = {
+    "retry_enabled": (bool, True),
+    "backoff_enabled": (bool, True),
+    "retry_policy": {
+        "type": RequestsStampede.policy.retry.InfiniteRetryPolicy,
+        "attempts": (int, sys.maxsize),
+    },
+    "backoff_policy": {
+        "type": RequestsStampede.policy.backoff.RandomBackoffPolicy,
+        "minimum_delay": (float, 3.0),
+        "maximum_delay": (float, 15.0),
+    },
+}
+
+
+class StatusAdapter(requests.adapters.BaseAdapter):
+    """
+    A transport adapter that never touches the network; every request sent
+    through it is recorded and answered with a fixed status code.
+    """
+
+    def __init__(self, status_code: int):
+        super().__init__()
+        self.status_code = status_code
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        # pylint: disable=arguments-differ,unused-argument
+        self.sent.append(request)
+
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.request = request
+        response.url = request.url
 
+        return response
 
-@pytest.fixture
-def retry_request_default():
+    def close(self):
+        pass
+
+
+def stub_session(status_code: int) -> requests.Session:
     """
-    TODO
+    Returns a requests.Session whose requests are answered by a StatusAdapter.
     """
-    return RequestsStampede.horde.RetryRequest()
+    session = requests.Session()
+    adapter = StatusAdapter(status_code)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
 
+    return session
 
-@pytest.fixture
-def retry_request_custom():
+
+def _normalize_policy(policy) -> dict:
     """
-    TODO
+    Returns the type of the given policy along with the type and value of each
+    of its public slotted attributes and properties.
     """
-    return RequestsStampede.horde.RetryRequest(
-        retry_config=RequestsStampede.config.AggressiveRetryConfig(
-            retry_policy=RequestsStampede.policy.retry.InfiniteRetryPolicy(),
-            backoff_policy=RequestsStampede.policy.backoff.RandomBackoffPolicy(),
+    attributes = {
+        name: (type(getattr(policy, name)), getattr(policy, name))
+        for cls in type(policy).__mro__
+        for name in (
+            *getattr(cls, "__slots__", ()),
+            *(name for name, value in vars(cls).items() if isinstance(value, property)),
+        )
+        if not name.startswith("_")
+    }
+
+    return {"type": type(policy), **attributes}
+
+
+def _normalize_config(retry_config) -> dict:
+    """
+    Returns a dictionary describing the given retry configuration, such that
+    configurations may be compared with a single equality check.
+    """
+    return {
+        "retry_enabled": (type(retry_config.retry_enabled), retry_config.retry_enabled),
+        "backoff_enabled": (
+            type(retry_config.backoff_enabled),
+            retry_config.backoff_enabled,
         ),
-        session=requests.Session(),
-    )
+        "retry_policy": _normalize_policy(retry_config.retry_policy),
+        "backoff_policy": _normalize_policy(retry_config.backoff_policy),
+    }
 
 
-@pytest.fixture
-def retry_session_default():
+def _assert_default_config(retry_config):
     """
-    TODO
+    Asserts that the given retry configuration is the default configuration.
     """
-    return RequestsStampede.horde.RetrySession()
+    assert isinstance(retry_config, RequestsStampede.config.DefaultRetryConfig)
+    assert _normalize_config(retry_config) == EXPECTED_DEFAULT_CONFIG
 
 
-@pytest.fixture
-def retry_session_custom():
+def _assert_custom_config(retry_config):
     """
-    TODO
+    Asserts that the given retry configuration is the custom configuration
+    constructed by the horde_instance fixture.
     """
-    custom_session = requests.Session()
-    custom_session.headers.update(
-        {"User-Agent": "RonSwanson/1.0", "Authorization": "Bearer ICanDoWhatIWant"}
-    )
+    assert isinstance(retry_config, RequestsStampede.config.AggressiveRetryConfig)
+    assert _normalize_config(retry_config) == EXPECTED_CUSTOM_CONFIG
+    assert retry_config.retry_policy.is_infinite is True
 
-    return RequestsStampede.horde.RetrySession(
-        retry_config=RequestsStampede.config.AggressiveRetryConfig(
-            retry_policy=RequestsStampede.policy.retry.InfiniteRetryPolicy(),
-            backoff_policy=RequestsStampede.policy.backoff.RandomBackoffPolicy(),
-        ),
-        session=custom_session,
-    )
+
+def _assert_custom_session(session):
+    """
+    Asserts that the given session carries the custom headers set by the
+    horde_instance fixture.
+    """
+    assert isinstance(session, requests.Session)
+    adapter = session.get_adapter("https://www.example.com/")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 20
+    assert isinstance(session.headers, requests.structures.CaseInsensitiveDict)
+    assert {
+        "User-Agent": "RonSwanson/1.0",
+        "Authorization": "Bearer ICanDoWhatIWant",
+    }.items() <= session.headers.items()
 
 
-def test_retry_request_default_parameters(retry_request_default):
+def test_horde_instance_parameters(horde_instance, aggressive_config):
     """
-    Ensures that RetryRequest default parameters are reasonable.
+    Ensures that RetryRequest and RetrySession default parameters are
+    reasonable, and that a custom retry configuration and session passed to
+    them actually modifies the necessary instance parameters.
     """
-    assert isinstance(
-        retry_request_default, RequestsStampede.horde.AbstractRetryRequest
-    )
-    assert isinstance(retry_request_default, RequestsStampede.horde.RetryRequest)
+    cls, mode, horde = horde_instance
+
+    assert isinstance(horde, RequestsStampede.horde.AbstractRetryRequest)
+    assert isinstance(horde, RequestsStampede.horde.RetryRequest)
+    assert isinstance(horde, cls)
 
     # Validate retry_config
-    retry_config = retry_request_default.retry_config
-    assert isinstance(retry_config, RequestsStampede.config.AbstractRetryConfig)
-    assert isinstance(retry_config, RequestsStampede.config.DefaultRetryConfig)
-    assert isinstance(retry_config.retry_enabled, bool)
-    assert isinstance(retry_config.backoff_enabled, bool)
-
-    # Ensure retries and backoff delays are enabled
-    assert retry_config.retry_enabled
-    assert retry_config.backoff_enabled
-
-    # Validate retry_config.retry_policy
-    retry_policy = retry_config.retry_policy
-    assert isinstance(retry_policy, RequestsStampede.policy.retry.AbstractRetryPolicy)
-    assert isinstance(retry_policy, RequestsStampede.policy.retry.FixedRetryPolicy)
-    assert isinstance(retry_policy.attempts, int)
-    assert retry_policy.attempts == 5
-
-    # Validate retry_config.backoff_policy
-    backoff_policy = retry_config.backoff_policy
-    assert isinstance(
-        backoff_policy, RequestsStampede.policy.backoff.AbstractBackoffPolicy
+    if mode == "default":
+        _assert_default_config(horde.retry_config)
+    else:
+        _assert_custom_config(horde.retry_config)
+        assert horde.retry_config is aggressive_config
+
+    # Validate session; only a default RetryRequest lacks one
+    if cls is RequestsStampede.horde.RetrySession and mode == "custom":
+        _assert_custom_session(horde.session)
+    elif cls is RequestsStampede.horde.RetryRequest and mode == "default":
+        assert horde.session is None
+    else:
+        assert isinstance(horde.session, requests.Session)
+
+    # Validate logger
+    assert isinstance(horde.logger, logging.Logger)
+
+
+def test_retry_request_subclass_retry_config(monkeypatch):
+    """
+    Ensures that a retry configuration set as a class attribute of a
+    RetryRequest subclass is used, without loading the environment specific
+    configuration.
+    """
+    class_retry_config = RequestsStampede.config.AggressiveRetryConfig()
+
+    class SubclassRetryRequest(RequestsStampede.horde.RetryRequest):
+        """
+        A RetryRequest with a class level retry configuration.
+        """
+
+        retry_config = class_retry_config
+
+    def load():
+        raise AssertionError("the retry configuration should not be loaded")
+
+    monkeypatch.setattr(RequestsStampede.config, "load", load)
+
+    assert SubclassRetryRequest().retry_config is class_retry_config
+
+
+def test_retry_request_default_session_reuses_connections():
+    """
+    Ensures that, without a provided session, RetryRequest creates a fresh
+    session per request whose transport adapter (and therefore connection
+    pool) is shared across requests, but not across instances.
+    """
+    # pylint: disable=protected-access
+    retry_request_default = RequestsStampede.horde.RetryRequest()
+
+    first = retry_request_default._request_session()
+    second = retry_request_default._request_session()
+
+    assert isinstance(first, requests.Session)
+    assert isinstance(second, requests.Session)
+    assert first is not second
+    assert first.get_adapter("https://www.example.com/") is second.get_adapter(
+        "https://www.example.com/"
     )
-    assert isinstance(
-        backoff_policy, RequestsStampede.policy.backoff.FibonacciBackoffPolicy
+    assert first.get_adapter("http://www.example.com/") is first.get_adapter(
+        "https://www.example.com/"
     )
-    assert isinstance(backoff_policy.initial_delay, float)
-    assert isinstance(backoff_policy.maximum_delay, float)
-    assert backoff_policy.initial_delay == 0.0
-    assert backoff_policy.maximum_delay == 144.0
 
-    # Validate session
-    assert retry_request_default.session is None
+    other = RequestsStampede.horde.RetryRequest()._request_session()
 
-    # Validate logger
-    assert isinstance(retry_request_default.logger, logging.Logger)
+    assert other.get_adapter("https://www.example.com/") is not first.get_adapter(
+        "https://www.example.com/"
+    )
 
 
-def test_retry_request_custom_parameters(retry_request_custom):
+@pytest.mark.parametrize("status_code", [200, 500])
+def test_retry_request_retry_disabled_single_attempt(status_code):
     """
-    Ensures that a custom retry configuration passed to RetryRequest actually
-    modifies the necessary instance parameters.
+    Ensures that a request is transmitted exactly once when retries have been
+    disabled, returning the response only if it was successful.
     """
-    assert isinstance(retry_request_custom, RequestsStampede.horde.AbstractRetryRequest)
-    assert isinstance(retry_request_custom, RequestsStampede.horde.RetryRequest)
+    session = stub_session(status_code)
 
-    # Validate retry_config
-    retry_config = retry_request_custom.retry_config
-    assert isinstance(retry_config, RequestsStampede.config.AbstractRetryConfig)
-    assert isinstance(retry_config, RequestsStampede.config.AggressiveRetryConfig)
-    assert isinstance(retry_config.retry_enabled, bool)
-    assert isinstance(retry_config.backoff_enabled, bool)
-
-    # Ensure retries and backoff delays are enabled
-    assert retry_config.retry_enabled
-    assert retry_config.backoff_enabled
-
-    # Validate retry_config.retry_policy
-    retry_policy = retry_config.retry_policy
-    assert isinstance(retry_policy, RequestsStampede.policy.retry.AbstractRetryPolicy)
-    assert isinstance(retry_policy, RequestsStampede.policy.retry.InfiniteRetryPolicy)
-    assert isinstance(retry_policy.attempts, float)
-    assert retry_policy.attempts == math.inf
-
-    # Validate retry_config.backoff_policy
-    backoff_policy = retry_config.backoff_policy
-    assert isinstance(
-        backoff_policy, RequestsStampede.policy.backoff.AbstractBackoffPolicy
+    horde = RequestsStampede.horde.RetryRequest(
+        retry_config=RequestsStampede.config.DefaultRetryConfig(retry_enabled=False),
+        session=session,
     )
-    assert isinstance(
-        backoff_policy, RequestsStampede.policy.backoff.RandomBackoffPolicy
+
+    response = horde.get("https://www.example.com/")
+
+    assert len(session.get_adapter("https://www.example.com/").sent) == 1
+
+    if status_code == 200:
+        assert isinstance(response, requests.Response)
+        assert response.ok
+    else:
+        assert response is None
+
+
+def test_retry_request_invalid_url():
+    """
+    Ensures that a request that cannot be prepared (i.e. an invalid URL) is
+    retried like any other unsuccessful request, rather than raising.
+    """
+    session = stub_session(200)
+
+    horde = RequestsStampede.horde.RetryRequest(
+        retry_config=RequestsStampede.config.DefaultRetryConfig(
+            retry_policy=RequestsStampede.policy.retry.FixedRetryPolicy(attempts=3),
+            backoff_policy=RequestsStampede.policy.backoff.FixedBackoffPolicy(0.0),
+        ),
+        session=session,
     )
-    assert isinstance(backoff_policy.minimum_delay, float)
-    assert isinstance(backoff_policy.maximum_delay, float)
-    assert backoff_policy.minimum_delay == 3.0
-    assert backoff_policy.maximum_delay == 15.0
 
-    # Validate session
-    assert isinstance(retry_request_custom.session, requests.Session)
+    assert horde.get("www.example.com") is None
+    assert horde.get("https://") is None
+    assert not session.get_adapter("https://www.example.com/").sent
 
-    # Validate logger
-    assert isinstance(retry_request_custom.logger, logging.Logger)
 
+def test_retry_request_single_attempt_invalid_url():
+    """
+    Ensures that a single attempt request that cannot be prepared (i.e. an
+    invalid URL) is unsuccessful, rather than raising.
+    """
+    session = stub_session(200)
+
+    horde = RequestsStampede.horde.RetryRequest(
+        retry_config=RequestsStampede.config.DefaultRetryConfig(retry_enabled=False),
+        session=session,
+    )
+
+    assert horde.get("www.example.com") is None
+    assert horde.get("https://") is None
+    assert not session.get_adapter("https://www.example.com/").sent
 
-def test_retry_session_default_parameters(retry_session_default):
+
+def test_retry_request_single_attempt_policy():
     """
-    Ensures that RetrySession default parameters are reasonable.
+    Ensures that a retry policy permitting a single attempt transmits the
+    request once, without inserting a backoff delay.
     """
-    assert isinstance(
-        retry_session_default, RequestsStampede.horde.AbstractRetryRequest
+    session = stub_session(500)
+
+    horde = RequestsStampede.horde.RetryRequest(
+        retry_config=RequestsStampede.config.DefaultRetryConfig(
+            retry_policy=RequestsStampede.policy.retry.FixedRetryPolicy(attempts=1)
+        ),
+        session=session,
     )
-    assert isinstance(retry_session_default, RequestsStampede.horde.RetryRequest)
-    assert isinstance(retry_session_default, RequestsStampede.horde.RetrySession)
 
-    # Validate retry_config
-    retry_config = retry_session_default.retry_config
-    assert isinstance(retry_config, RequestsStampede.config.AbstractRetryConfig)
-    assert isinstance(retry_config, RequestsStampede.config.DefaultRetryConfig)
-    assert isinstance(retry_config.retry_enabled, bool)
-    assert isinstance(retry_config.backoff_enabled, bool)
-
-    # Ensure retries and backoff delays are enabled
-    assert retry_config.retry_enabled
-    assert retry_config.backoff_enabled
-
-    # Validate retry_config.retry_policy
-    retry_policy = retry_config.retry_policy
-    assert isinstance(retry_policy, RequestsStampede.policy.retry.AbstractRetryPolicy)
-    assert isinstance(retry_policy, RequestsStampede.policy.retry.FixedRetryPolicy)
-    assert isinstance(retry_policy.attempts, int)
-    assert retry_policy.attempts == 5
-
-    # Validate retry_config.backoff_policy
-    backoff_policy = retry_config.backoff_policy
-    assert isinstance(
-        backoff_policy, RequestsStampede.policy.backoff.AbstractBackoffPolicy
+    assert horde.post("https://www.example.com/", data={"foo": "bar"}) is None
+    assert len(session.get_adapter("https://www.example.com/").sent) == 1
+
+
+def test_retry_session_retry_sends_cookies_from_failed_attempt(monkeypatch):
+    """
+    Ensures that a cookie set by the server on an unsuccessful response is
+    sent by the following retry attempt.
+    """
+    horde = RequestsStampede.horde.RetrySession(
+        retry_config=RequestsStampede.config.DefaultRetryConfig(
+            retry_policy=RequestsStampede.policy.retry.FixedRetryPolicy(attempts=2)
+        ),
+        session=requests.Session(),
     )
-    assert isinstance(
-        backoff_policy, RequestsStampede.policy.backoff.FibonacciBackoffPolicy
+
+    monkeypatch.setattr(RequestsStampede.horde, "sleep", lambda delay: None)
+
+    with responses.RequestsMock() as mock:
+        mock.add(
+            "GET",
+            "https://www.example.com/",
+            status=503,
+            headers={"Set-Cookie": "challenge=ok; Path=/"},
+        )
+        mock.add("GET", "https://www.example.com/", status=200)
+
+        response = horde.get("https://www.example.com/")
+
+        cookies = [call.request.headers.get("Cookie") for call in mock.calls]
+
+    assert response.ok
+    assert cookies == [None, "challenge=ok"]
+
+
+def test_retry_request_backoff_includes_attempt_duration(monkeypatch):
+    """
+    Ensures that the time spent on a failed attempt counts towards the backoff
+    delay that follows it.
+    """
+    session = stub_session(500)
+
+    horde = RequestsStampede.horde.RetryRequest(
+        retry_config=RequestsStampede.config.DefaultRetryConfig(
+            retry_policy=RequestsStampede.policy.retry.FixedRetryPolicy(attempts=3),
+            backoff_policy=RequestsStampede.policy.backoff.FixedBackoffPolicy(5.0),
+        ),
+        session=session,
     )
-    assert isinstance(backoff_policy.initial_delay, float)
-    assert isinstance(backoff_policy.maximum_delay, float)
-    assert backoff_policy.initial_delay == 0.0
-    assert backoff_policy.maximum_delay == 144.0
 
-    # Validate session
-    assert isinstance(retry_session_default.session, requests.Session)
+    # The first attempt takes 2 seconds to fail, the second fails immediately
+    clock = iter([0.0, 2.0, 10.0, 10.0, 20.0])
+    sleeps = []
 
-    # Validate logger
-    assert isinstance(retry_session_default.logger, logging.Logger)
+    monkeypatch.setattr(RequestsStampede.horde, "monotonic", lambda: next(clock))
+    monkeypatch.setattr(RequestsStampede.horde, "sleep", sleeps.append)
 
+    assert horde.get("https://www.example.com/") is None
+    assert len(session.get_adapter("https://www.example.com/").sent) == 3
+    assert sleeps == [3.0, 5.0]
 
-def test_retry_session_custom_parameters(retry_session_custom):
+
+def test_retry_request_backoff_logged_once_per_retry(monkeypatch, caplog):
     """
-    TODO
+    Ensures that each backoff delay is logged by a single message.
     """
-    assert isinstance(retry_session_custom, RequestsStampede.horde.AbstractRetryRequest)
-    assert isinstance(retry_session_custom, RequestsStampede.horde.RetryRequest)
-    assert isinstance(retry_session_custom, RequestsStampede.horde.RetrySession)
+    session = stub_session(500)
 
-    # Validate retry_config
-    retry_config = retry_session_custom.retry_config
-    assert isinstance(retry_config, RequestsStampede.config.AbstractRetryConfig)
-    assert isinstance(retry_config, RequestsStampede.config.AggressiveRetryConfig)
-    assert isinstance(retry_config.retry_enabled, bool)
-    assert isinstance(retry_config.backoff_enabled, bool)
-
-    # Ensure retries and backoff delays are enabled
-    assert retry_config.retry_enabled
-    assert retry_config.backoff_enabled
-
-    # Validate retry_config.retry_policy
-    retry_policy = retry_config.retry_policy
-    assert isinstance(retry_policy, RequestsStampede.policy.retry.AbstractRetryPolicy)
-    assert isinstance(retry_policy, RequestsStampede.policy.retry.InfiniteRetryPolicy)
-    assert isinstance(retry_policy.attempts, float)
-    assert retry_policy.attempts == math.inf
-
-    # Validate retry_config.backoff_policy
-    backoff_policy = retry_config.backoff_policy
-    assert isinstance(
-        backoff_policy, RequestsStampede.policy.backoff.AbstractBackoffPolicy
+    horde = RequestsStampede.horde.RetryRequest(
+        retry_config=RequestsStampede.config.DefaultRetryConfig(
+            retry_policy=RequestsStampede.policy.retry.FixedRetryPolicy(attempts=3),
+            backoff_policy=RequestsStampede.policy.backoff.FixedBackoffPolicy(5.0),
+        ),
+        session=session,
+    )
+
+    monkeypatch.setattr(RequestsStampede.horde, "sleep", lambda delay: None)
+
+    with caplog.at_level(logging.INFO, logger="RequestsStampede"):
+        assert horde.get("https://www.example.com/") is None
+
+    backoff_messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith("Backing off")
+    ]
+
+    assert backoff_messages == [
+        "Backing off 5.000s before retry 2",
+        "Backing off 5.000s before retry 3",
+    ]
+
+
+def test_horde_import_defers_async_dependencies():
+    """
+    Ensures that importing the horde module does not import asyncio or httpx,
+    which are only required by AsyncRetryRequest.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, RequestsStampede.horde; "
+            "print(sorted({'asyncio', 'httpx'} & set(sys.modules)))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
     )
-    assert isinstance(
-        backoff_policy, RequestsStampede.policy.backoff.RandomBackoffPolicy
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_async_retry_request_retry_sends_cookies_from_failed_attempt(monkeypatch):
+    """
+    Ensures that a cookie set by the server on an unsuccessful response is
+    sent by the following asynchronous retry attempt.
+    """
+    httpx = pytest.importorskip("httpx")
+
+    results = iter(
+        [
+            httpx.Response(503, headers={"Set-Cookie": "challenge=ok; Path=/"}),
+            httpx.Response(200),
+        ]
     )
-    assert isinstance(backoff_policy.minimum_delay, float)
-    assert isinstance(backoff_policy.maximum_delay, float)
-    assert backoff_policy.minimum_delay == 3.0
-    assert backoff_policy.maximum_delay == 15.0
+    cookies = []
 
-    # Validate session
-    session = retry_session_custom.session
-    assert isinstance(session, requests.Session)
-    assert isinstance(session.headers, requests.structures.CaseInsensitiveDict)
-    assert "User-Agent" in session.headers
-    assert session.headers.get("User-Agent") == "RonSwanson/1.0"
-    assert "Authorization" in session.headers
-    assert session.headers.get("Authorization") == "Bearer ICanDoWhatIWant"
+    def handler(request):
+        cookies.append(request.headers.get("Cookie"))
+        return next(results)
 
-    # Validate logger
-    assert isinstance(retry_session_custom.logger, logging.Logger)
+    async def sleep(_delay):
+        pass
+
+    monkeypatch.setattr(RequestsStampede.horde, "_async_sleep", sleep)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            horde = RequestsStampede.horde.AsyncRetryRequest(
+                retry_config=RequestsStampede.config.DefaultRetryConfig(
+                    retry_policy=RequestsStampede.policy.retry.FixedRetryPolicy(2)
+                ),
+                session=client,
+            )
+
+            return await horde.get("https://www.example.com/")
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert cookies == [None, "challenge=ok"]
+
+
+def test_async_retry_request_logging_gated(monkeypatch, caplog):
+    """
+    Ensures that AsyncRetryRequest skips INFO and DEBUG log calls entirely
+    when those levels are disabled.
+    """
+    httpx = pytest.importorskip("httpx")
+
+    logged = []
+
+    monkeypatch.setattr(RequestsStampede.horde, "monotonic", lambda: 0.0)
+
+    async def sleep(delay):
+        logged.append(("sleep", delay))
+
+    monkeypatch.setattr(RequestsStampede.horde, "_async_sleep", sleep)
+
+    async def run():
+        transport = httpx.MockTransport(lambda request: httpx.Response(500))
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            horde = RequestsStampede.horde.AsyncRetryRequest(
+                retry_config=RequestsStampede.config.DefaultRetryConfig(
+                    retry_policy=RequestsStampede.policy.retry.FixedRetryPolicy(3)
+                ),
+                session=client,
+            )
+
+            for level in ("info", "debug"):
+                monkeypatch.setattr(
+                    horde.logger, level, lambda *args: logged.append(args)
+                )
+
+            return await horde.get("https://www.example.com/")
+
+    with caplog.at_level(logging.WARNING, logger="RequestsStampede"):
+        assert asyncio.run(run()) is None
+
+    assert logged == [("sleep", 1.0)]
+
+
+@pytest.mark.parametrize("status_codes", [[200], [500, 503, 200], [500, 500, 500]])
+def test_async_retry_request(status_codes, monkeypatch):
+    """
+    Ensures that AsyncRetryRequest retries unsuccessful requests, awaiting the
+    backoff delay between attempts, until a successful response is received or
+    the retry policy is exhausted.
+    """
+    httpx = pytest.importorskip("httpx")
+
+    results = iter(status_codes)
+    sent = []
+    sleeps = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(next(results))
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(RequestsStampede.horde, "_async_sleep", sleep)
+    monkeypatch.setattr(RequestsStampede.horde, "monotonic", lambda: 0.0)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            horde = RequestsStampede.horde.AsyncRetryRequest(
+                retry_config=RequestsStampede.config.DefaultRetryConfig(
+                    retry_policy=RequestsStampede.policy.retry.FixedRetryPolicy(3),
+                    backoff_policy=RequestsStampede.policy.backoff.FixedBackoffPolicy(
+                        2.0
+                    ),
+                ),
+                session=client,
+            )
+
+            return await horde.post("https://www.example.com/", json={"foo": "bar"})
+
+    response = asyncio.run(run())
+
+    assert len(sent) == len(status_codes)
+    assert all(json.loads(request.content) == {"foo": "bar"} for request in sent)
+    assert sleeps == [2.0] * (len(status_codes) - 1)
+
+    if status_codes[-1] == 200:
+        assert isinstance(response, httpx.Response)
+        assert response.status_code == 200
+    else:
+        assert response is None
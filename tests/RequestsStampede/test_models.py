@@ -0,0 +1,281 @@
+# pylint: disable=redefined-outer-name
+
+"""
+Tests the internal models present in RequestsStampede.models
+"""
+
+
+import itertools
+import math
+
+import pytest
+import requests
+import requests.exceptions
+
+import RequestsStampede.config
+import RequestsStampede.models
+import RequestsStampede.policy.retry
+import RequestsStampede.policy.backoff
+
+
+@pytest.fixture
+def request_parameters():
+    """
+    A basic GET request that is never transmitted.
+    """
+    return RequestsStampede.models.RequestParameters(
+        http_method="GET",
+        url="https://www.example.com/",
+        session=requests.Session(),
+        kwargs={},
+    )
+
+
+def test_request_attempt_sequence_finite(request_parameters):
+    """
+    Ensures that a fixed retry policy yields exactly the configured number of
+    attempts, with a backoff delay following every attempt but the last.
+    """
+    retry_config = RequestsStampede.config.DefaultRetryConfig()
+
+    attempt_sequence = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, retry_config
+    )
+
+    attempts = list(attempt_sequence.attempts())
+
+    assert [attempt.attempt for attempt in attempts] == [1, 2, 3, 4, 5]
+    assert [attempt.backoff for attempt in attempts] == [0.0, 1.0, 1.0, 2.0, None]
+
+
+def test_request_attempt_sequence_infinite(request_parameters):
+    """
+    Ensures that an infinite retry policy continues to yield attempts.
+    """
+    retry_config = RequestsStampede.config.AggressiveRetryConfig()
+
+    attempt_sequence = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, retry_config
+    )
+
+    attempts = list(itertools.islice(attempt_sequence.attempts(), 100))
+
+    assert [attempt.attempt for attempt in attempts] == list(range(1, 101))
+    assert all(attempt.backoff == 5.0 for attempt in attempts)
+
+
+def test_request_attempt_sequence_backoff_disabled(request_parameters):
+    """
+    Ensures that no backoff delays are scheduled when backoff delays have been
+    disabled.
+    """
+    retry_config = RequestsStampede.config.DefaultRetryConfig(
+        retry_policy=RequestsStampede.policy.retry.FixedRetryPolicy(attempts=3)
+    )
+    retry_config.backoff_enabled = False
+
+    attempt_sequence = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, retry_config
+    )
+
+    attempts = list(attempt_sequence.attempts())
+
+    assert [attempt.attempt for attempt in attempts] == [1, 2, 3]
+    assert [attempt.backoff for attempt in attempts] == [None, None, None]
+
+
+def test_request_attempt_sequence_prepares_on_execution(request_parameters):
+    """
+    Ensures that the attempts of a sequence are only prepared when executed,
+    each attempt preparing its own request.
+    """
+    retry_config = RequestsStampede.config.DefaultRetryConfig()
+
+    attempt_sequence = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, retry_config
+    )
+
+    attempts = list(attempt_sequence.attempts())
+
+    assert all(attempt.prepared is None for attempt in attempts)
+
+    prepared = [attempt.prepare() for attempt in attempts[:2]]
+
+    assert all(isinstance(item, requests.PreparedRequest) for item in prepared)
+    assert [item.method for item in prepared] == ["GET", "GET"]
+    assert [item.url for item in prepared] == ["https://www.example.com/"] * 2
+    assert prepared[0] is not prepared[1]
+
+
+def test_request_attempt_sequence_invalid_url(request_parameters):
+    """
+    Ensures that a request that cannot be prepared does not fail until one of
+    its attempts is executed.
+    """
+    request_parameters.url = "www.example.com"
+
+    attempt_sequence = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, RequestsStampede.config.DefaultRetryConfig()
+    )
+
+    with pytest.raises(requests.exceptions.MissingSchema):
+        next(attempt_sequence.attempts()).execute()
+
+
+def test_request_attempt_sequence_finite_backoffs_drawn_once(request_parameters):
+    """
+    Ensures that the backoff delays of a finite retry policy are drawn once,
+    when the sequence is constructed, rather than per attempt.
+    """
+    retry_config = RequestsStampede.config.DefaultRetryConfig(
+        backoff_policy=RequestsStampede.policy.backoff.RandomBackoffPolicy()
+    )
+
+    attempt_sequence = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, retry_config
+    )
+
+    first = [attempt.backoff for attempt in attempt_sequence.attempts()]
+    second = [attempt.backoff for attempt in attempt_sequence.attempts()]
+
+    assert len(first) == 5
+    assert first[-1] is None
+    assert first == second
+
+
+def test_models_are_slotted(request_parameters):
+    """
+    Ensures that the per-request models do not allocate an instance __dict__.
+    """
+    attempt_sequence = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, RequestsStampede.config.DefaultRetryConfig()
+    )
+    attempt = next(attempt_sequence.attempts())
+
+    for model in (request_parameters, attempt_sequence, attempt):
+        assert not hasattr(model, "__dict__")
+
+
+def test_request_attempt_sequence_retry_disabled(request_parameters):
+    """
+    Ensures that only the initial attempt is made when retries have been
+    disabled.
+    """
+    retry_config = RequestsStampede.config.DefaultRetryConfig(retry_enabled=False)
+
+    attempt_sequence = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, retry_config
+    )
+
+    attempts = list(attempt_sequence.attempts())
+
+    assert [attempt.attempt for attempt in attempts] == [1]
+    assert [attempt.backoff for attempt in attempts] == [None]
+
+
+def test_request_attempt_sequence_infinite_backoff_disabled(request_parameters):
+    """
+    Ensures that an infinite retry policy without backoff delays continues to
+    yield attempts.
+    """
+    retry_config = RequestsStampede.config.AggressiveRetryConfig()
+    retry_config.backoff_enabled = False
+
+    attempt_sequence = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, retry_config
+    )
+
+    attempts = list(itertools.islice(attempt_sequence.attempts(), 100))
+
+    assert [attempt.attempt for attempt in attempts] == list(range(1, 101))
+    assert all(attempt.backoff is None for attempt in attempts)
+
+
+def test_request_attempt_sequences_share_policy_independently(request_parameters):
+    """
+    Ensures that sequences created from the same retry configuration each
+    start from the beginning of the backoff policy's sequence, including
+    infinite sequences that are consumed concurrently.
+    """
+    retry_config = RequestsStampede.config.CustomRetryConfig(
+        retry_policy=RequestsStampede.policy.retry.InfiniteRetryPolicy(),
+        backoff_policy=RequestsStampede.policy.backoff.FibonacciBackoffPolicy(),
+    )
+
+    first = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, retry_config
+    ).attempts()
+    second = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, retry_config
+    ).attempts()
+
+    assert [next(first).backoff for _ in range(4)] == [0.0, 1.0, 1.0, 2.0]
+    assert [next(second).backoff for _ in range(4)] == [0.0, 1.0, 1.0, 2.0]
+    assert next(first).backoff == 3.0
+
+
+def test_request_attempt_sequence_math_inf_attempts(request_parameters):
+    """
+    Ensures that a retry policy signalling an infinite number of attempts with
+    math.inf, rather than is_infinite, continues to yield attempts.
+    """
+
+    class MathInfRetryPolicy(RequestsStampede.policy.retry.AbstractRetryPolicy):
+        """
+        A retry policy following the convention predating is_infinite.
+        """
+
+        attempts = math.inf
+
+    retry_config = RequestsStampede.config.DefaultRetryConfig(
+        retry_policy=MathInfRetryPolicy()
+    )
+
+    for backoff_enabled in (True, False):
+        retry_config.backoff_enabled = backoff_enabled
+
+        attempts = itertools.islice(
+            RequestsStampede.models.RequestAttemptSequence(
+                request_parameters, retry_config
+            ).attempts(),
+            100,
+        )
+
+        assert [attempt.attempt for attempt in attempts] == list(range(1, 101))
+
+
+def test_request_attempt_sequence_long_finite_backoffs(request_parameters):
+    """
+    Ensures that only the leading backoff delays of a long finite retry policy
+    are drawn up front, while the remaining delays follow the backoff policy.
+    """
+    retry_config = RequestsStampede.config.DefaultRetryConfig(
+        retry_policy=RequestsStampede.policy.retry.FixedRetryPolicy(attempts=100)
+    )
+
+    attempt_sequence = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters, retry_config
+    )
+
+    # pylint: disable=protected-access
+    assert len(attempt_sequence._backoffs) < 99
+
+    attempts = list(attempt_sequence.attempts())
+
+    assert [attempt.attempt for attempt in attempts] == list(range(1, 101))
+    assert [attempt.backoff for attempt in attempts] == [
+        *retry_config.backoff_policy.as_array(99),
+        None,
+    ]
+
+    huge_sequence = RequestsStampede.models.RequestAttemptSequence(
+        request_parameters,
+        RequestsStampede.config.DefaultRetryConfig(
+            retry_policy=RequestsStampede.policy.retry.FixedRetryPolicy(5_000_000)
+        ),
+    )
+
+    attempts = itertools.islice(huge_sequence.attempts(), 5)
+
+    assert len(huge_sequence._backoffs) < 99
+    assert [attempt.backoff for attempt in attempts] == [0.0, 1.0, 1.0, 2.0, 3.0]
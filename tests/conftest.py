@@ -0,0 +1,86 @@
+"""
+Fixtures shared by the RequestsStampede usage tests.
+"""
+
+
+import pytest
+import requests
+import requests.adapters
+
+import RequestsStampede.horde
+
+
+def pytest_addoption(parser):
+    """
+    Adds the option that opts in to the integration tests, which reach
+    external services and wait through real backoff delays.
+    """
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests that require network access to external services",
+    )
+
+
+def pytest_configure(config):
+    """
+    Registers the integration marker.
+    """
+    config.addinivalue_line(
+        "markers", "integration: requires network access to external services"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skips the integration tests unless they were opted in to.
+    """
+    if config.getoption("--run-integration"):
+        return
+
+    skip_integration = pytest.mark.skip(reason="needs --run-integration to run")
+
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope="module")
+def horde():
+    """
+    A default RetryRequest, shared by the tests of a module. Without a
+    provided session, RetryRequest keeps no state between requests.
+    """
+    return RequestsStampede.horde.RetryRequest()
+
+
+@pytest.fixture(scope="session")
+def shared_horde():
+    """
+    A RetryRequest whose session, and therefore connection pool, is shared
+    by every test that requests it.
+    """
+    session = requests.Session()
+
+    adapter = requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return RequestsStampede.horde.RetryRequest(session=session)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """
+    Records, rather than sleeps, the backoff delays inserted between request
+    attempts. The clock is replaced by a virtual one that only advances by the
+    recorded delays, so that request attempts take no time and the full
+    backoff delays are recorded.
+    """
+    recorded = []
+
+    monkeypatch.setattr(RequestsStampede.horde, "sleep", recorded.append)
+    monkeypatch.setattr(RequestsStampede.horde, "monotonic", lambda: sum(recorded))
+
+    return recorded
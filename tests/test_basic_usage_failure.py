@@ -1,3 +1,5 @@
+# pylint: disable=redefined-outer-name
+
 """
 TODO :)
 """
@@ -5,151 +7,62 @@ TODO :)
 
 import time
 
-import RequestsStampede.horde
-
-
-def test_basic_get_failure():
-    """
-    Tests RequestsStampede.horde.RetryRequest.get()'s default behavior during
-    request failures.
-    """
-    start_time = time.perf_counter()
-
-    horde = RequestsStampede.horde.RetryRequest()
-
-    response = horde.get("https://httpstat.us/500")
-
-    end_time = time.perf_counter()
-    elapsed_time = end_time - start_time
-
-    # The default retry configuration attempts 5 retries with fibonacci backoff
-    # delays. As such, the elapsed time should be greater than 4 seconds:
-    # sum([0, 1, 1, 2, 0])
-    assert elapsed_time > 4.0
-    assert response is None
+import pytest
 
+import RequestsStampede.horde
 
-def test_basic_options_failure():
-    """
-    Tests RequestsStampede.horde.RetryRequest.options()'s default behavior
-    during request failures.
-    """
-    start_time = time.perf_counter()
-
-    horde = RequestsStampede.horde.RetryRequest()
-
-    response = horde.options("https://httpstat.us/500")
-
-    end_time = time.perf_counter()
-    elapsed_time = end_time - start_time
-
-    # The default retry configuration attempts 5 retries with fibonacci backoff
-    # delays. As such, the elapsed time should be greater than 4 seconds:
-    # sum([0, 1, 1, 2, 0])
-    assert elapsed_time > 4.0
-    assert response is None
-
-
-def test_basic_head_failure():
-    """
-    Tests RequestsStampede.horde.RetryRequest.head()'s default behavior during
-    request failures.
-    """
-    start_time = time.perf_counter()
-
-    horde = RequestsStampede.horde.RetryRequest()
-
-    response = horde.head("https://httpstat.us/500")
-
-    end_time = time.perf_counter()
-    elapsed_time = end_time - start_time
 
-    # The default retry configuration attempts 5 retries with fibonacci backoff
-    # delays. As such, the elapsed time should be greater than 4 seconds:
-    # sum([0, 1, 1, 2, 0])
-    assert elapsed_time > 4.0
-    assert response is None
+# The backoff delays slept by the default retry configuration, which attempts 5
+# retries with fibonacci backoff delays: [0, 1, 1, 2]. There is no delay after
+# the final attempt, and the zero second delay is not slept.
+EXPECTED_SCHEDULE = (1.0, 1.0, 2.0)
 
 
-def test_basic_post_failure():
+@pytest.fixture
+def failing_url(httpserver):
     """
-    Tests RequestsStampede.horde.RetryRequest.post()'s default behavior during
-    request failures.
+    Serves an always failing endpoint, for any HTTP method, from a local HTTP
+    server.
     """
-    start_time = time.perf_counter()
+    httpserver.expect_request("/fail").respond_with_data("err", status=500)
 
-    horde = RequestsStampede.horde.RetryRequest()
-
-    response = horde.post("https://httpstat.us/500")
+    return httpserver.url_for("/fail")
 
-    end_time = time.perf_counter()
-    elapsed_time = end_time - start_time
-
-    # The default retry configuration attempts 5 retries with fibonacci backoff
-    # delays. As such, the elapsed time should be greater than 4 seconds:
-    # sum([0, 1, 1, 2, 0])
-    assert elapsed_time > 4.0
-    assert response is None
 
-
-def test_basic_put_failure():
+@pytest.mark.parametrize(
+    "http_method", ["get", "options", "head", "post", "put", "patch", "delete"]
+)
+def test_basic_failure(horde, http_method, httpserver, failing_url, sleeps):
     """
-    Tests RequestsStampede.horde.RetryRequest.put()'s default behavior during
-    request failures.
+    Tests the default behavior of each of RequestsStampede.horde.RetryRequest's
+    HTTP methods during request failures.
     """
-    start_time = time.perf_counter()
-
-    horde = RequestsStampede.horde.RetryRequest()
+    start_time = RequestsStampede.horde.monotonic()
 
-    response = horde.put("https://httpstat.us/500")
+    response = getattr(horde, http_method)(failing_url)
 
-    end_time = time.perf_counter()
-    elapsed_time = end_time - start_time
+    elapsed_time = RequestsStampede.horde.monotonic() - start_time
 
-    # The default retry configuration attempts 5 retries with fibonacci backoff
-    # delays. As such, the elapsed time should be greater than 4 seconds:
-    # sum([0, 1, 1, 2, 0])
-    assert elapsed_time > 4.0
     assert response is None
+    assert len(httpserver.log) == 5
+    assert tuple(sleeps) == EXPECTED_SCHEDULE
+    assert elapsed_time == sum(EXPECTED_SCHEDULE)
 
 
-def test_basic_patch_failure():
+@pytest.mark.integration
+def test_basic_failure_integration():
     """
-    Tests RequestsStampede.horde.RetryRequest.patch()'s default behavior during
-    request failures.
+    Tests RequestsStampede.horde.RetryRequest.get()'s default behavior during
+    request failures against the live httpstat.us service, waiting through
+    the real backoff delays.
     """
-    start_time = time.perf_counter()
-
     horde = RequestsStampede.horde.RetryRequest()
 
-    response = horde.patch("https://httpstat.us/500")
-
-    end_time = time.perf_counter()
-    elapsed_time = end_time - start_time
-
-    # The default retry configuration attempts 5 retries with fibonacci backoff
-    # delays. As such, the elapsed time should be greater than 4 seconds:
-    # sum([0, 1, 1, 2, 0])
-    assert elapsed_time > 4.0
-    assert response is None
-
-
-def test_basic_delete_failure():
-    """
-    Tests RequestsStampede.horde.RetryRequest.delete()'s default behavior during
-    request failures.
-    """
     start_time = time.perf_counter()
 
-    horde = RequestsStampede.horde.RetryRequest()
-
-    response = horde.delete("https://httpstat.us/500")
+    response = horde.get("https://httpstat.us/500")
 
-    end_time = time.perf_counter()
-    elapsed_time = end_time - start_time
+    elapsed_time = time.perf_counter() - start_time
 
-    # The default retry configuration attempts 5 retries with fibonacci backoff
-    # delays. As such, the elapsed time should be greater than 4 seconds:
-    # sum([0, 1, 1, 2, 0])
-    assert elapsed_time > 4.0
+    assert elapsed_time > sum(EXPECTED_SCHEDULE)
     assert response is None
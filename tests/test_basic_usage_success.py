@@ -1,20 +1,55 @@
+# pylint: disable=redefined-outer-name
+
 """
 TODO :)
 """
 
 
+import json
+import urllib.parse
+
+import pytest
 import requests
+import responses
+
 
-import RequestsStampede.horde
+def httpbin_echo(request: requests.PreparedRequest) -> tuple:
+    """
+    Answers a request in the manner of httpbin.org, echoing its URL and any
+    form data it carried.
+    """
+    body = request.body or ""
 
+    if isinstance(body, bytes):
+        body = body.decode()
 
-def test_basic_get_success():
+    payload = {"url": request.url, "form": dict(urllib.parse.parse_qsl(body))}
+
+    return 200, {}, json.dumps(payload)
+
+
+@pytest.fixture(autouse=True)
+def httpbin():
     """
-    Tests RequestsStampede.horde.RetryRequest.get()
+    Serves the httpbin.org endpoints used by these tests locally, without
+    network access.
     """
-    horde = RequestsStampede.horde.RetryRequest()
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        for http_method in ("get", "post", "put", "patch", "delete"):
+            mock.add_callback(
+                http_method.upper(),
+                f"https://httpbin.org/{http_method}",
+                callback=httpbin_echo,
+            )
 
-    response = horde.get("https://httpbin.org/get")
+        yield mock
+
+
+def test_basic_get_success(shared_horde):
+    """
+    Tests RequestsStampede.horde.RetryRequest.get()
+    """
+    response = shared_horde.get("https://httpbin.org/get")
 
     assert isinstance(response, requests.Response)
     assert response.ok
@@ -42,13 +77,11 @@ def test_basic_head_success():
     """
 
 
-def test_basic_post_success():
+def test_basic_post_success(shared_horde):
     """
     Tests RequestsStampede.horde.RetryRequest.post()
     """
-    horde = RequestsStampede.horde.RetryRequest()
-
-    response = horde.post(
+    response = shared_horde.post(
         "https://httpbin.org/post", data={"hello": "world", "foo": "bar"}
     )
 
@@ -72,13 +105,11 @@ def test_basic_post_success():
     assert form.get("foo") == "bar"
 
 
-def test_basic_put_success():
+def test_basic_put_success(shared_horde):
     """
     Tests RequestsStampede.horde.RetryRequest.put()
     """
-    horde = RequestsStampede.horde.RetryRequest()
-
-    response = horde.put(
+    response = shared_horde.put(
         "https://httpbin.org/put", data={"hello": "world", "foo": "bar"}
     )
 
@@ -102,13 +133,11 @@ def test_basic_put_success():
     assert form.get("foo") == "bar"
 
 
-def test_basic_patch_success():
+def test_basic_patch_success(shared_horde):
     """
     Tests RequestsStampede.horde.RetryRequest.patch()
     """
-    horde = RequestsStampede.horde.RetryRequest()
-
-    response = horde.patch("https://httpbin.org/patch")
+    response = shared_horde.patch("https://httpbin.org/patch")
 
     assert isinstance(response, requests.Response)
     assert response.ok
@@ -120,13 +149,11 @@ def test_basic_patch_success():
     assert json.get("url") == "https://httpbin.org/patch"
 
 
-def test_basic_delete_success():
+def test_basic_delete_success(shared_horde):
     """
     Tests RequestsStampede.horde.RetryRequest.delete()
     """
-    horde = RequestsStampede.horde.RetryRequest()
-
-    response = horde.delete("https://httpbin.org/delete")
+    response = shared_horde.delete("https://httpbin.org/delete")
 
     assert isinstance(response, requests.Response)
     assert response.ok